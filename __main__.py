@@ -1,5 +1,6 @@
 """ Entry point for the execution of the main package. """
 
+import os
 import json
 import pygame
 from pygame.locals import *
@@ -13,6 +14,13 @@ from .games.breakout import Breakout
 from .games.asteroids import Asteroids
 from .games.tetris import Tetris
 
+DEFAULT_HIGH_SCORES = {"Snake": 0,
+                       "Breakout": 0,
+                       "Asteroids": 0,
+                       "Tetris": 0,
+                       }
+""" Contents of a newly created `high-scores.json`. """
+
 
 class Brickgame(BaseClient):
     """
@@ -20,37 +28,38 @@ class Brickgame(BaseClient):
 
     Attributes
     ----------
-    environment : str
-        The active environment for user input.
+    environment : int
+        The active environment for user input (``ENV_SELECTOR`` or
+        ``ENV_GAME``).
     game : Type[Game]
         The current game being played.
     """
 
-    environment = "selector"
+    environment = ENV_SELECTOR
     game = None
     
     def __init__(self):
         """ Initializing the GUI. """
 
         # Create the .json file, if it doesn't already exist.
-        try: 
-            with open(high_scores_dir, "x") as file:
-                json.dump({
-                    "Snake": 0,
-                    "Breakout": 0,
-                    "Asteroids": 0,
-                    "Tetris": 0,
-                }, file)
-            print("File `high-scores.json` successfully created at",
-                  package_dir)
-        except Exception as e:
-            print(e)
+        if not os.path.exists(high_scores_dir):
+            try:
+                with open(high_scores_dir, "w") as file:
+                    json.dump(DEFAULT_HIGH_SCORES, file)
+                print("File `high-scores.json` successfully created at",
+                      package_dir)
+            except Exception as e:
+                print(e)
         
         super().__init__()
         pygame.display.set_caption("Game Selection")
 
         # Render the environments.
         self.selector = self.Selector()
+        # Keybindings for each environment.
+        self._env_handlers = {ENV_SELECTOR: self.selector.handle_events,
+                              ENV_GAME: self._game_handle_events,
+                              }
 
         # Draw the background.
         Background()
@@ -63,17 +72,24 @@ class Brickgame(BaseClient):
         ----------
         t : int
             A timer.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            The areas of the screen to update (all of it with ``None``).
         """
 
-        if self.environment == "selector":
-            self.selector.animate_screen(t)
-        elif self.environment == "game":
-            # Implement the game mechanics and check for endgame.
-            self.game.manage(t)
+        if self.environment == ENV_SELECTOR:
+            return self.selector.animate_screen(t)
+        elif self.environment == ENV_GAME:
+            # Implement the game mechanics and check for endgame, on
+            # the frames where the game can change.
+            if t % self.game.action_period == 0:
+                self.game.manage(t)
             # Update sprites' mechanics.
             self.game.update_entities(t=t)
             # Show the game's current state.
-            self.game.draw_entities()
+            return self.game.draw_entities()
 
     def handle_events(self, key, state):
         """
@@ -88,17 +104,29 @@ class Brickgame(BaseClient):
         """
 
         if state in (KEYDOWN, KEYUP):
-            if self.environment == "selector":
-                # Shift to `selector` keybindings.
-                self.selector.handle_events(key, state)
-            elif self.environment == "game":
-                # Leave the `game` instance if *Backspace* is pressed.
-                if (key, state) == (K_BACKSPACE, KEYDOWN):
-                    Brickgame.environment = "selector"
-                    pygame.display.set_caption("Game Selection")
-                else:
-                    # Shift to `game` keybindings otherwise.
-                    self.game.handle_events(key, state)
+            # Shift to the active environment's keybindings.
+            self._env_handlers[self.environment](key, state)
+
+    def _game_handle_events(self, key, state):
+        """
+        Deal with user input during a game.
+
+        Parameters
+        ----------
+        key : int
+            A key id.
+        state : int
+            `KEYDOWN` or `KEYUP`.
+        """
+
+        # Leave the `game` instance if *Backspace* is pressed.
+        if (key, state) == (K_BACKSPACE, KEYDOWN):
+            Brickgame.environment = ENV_SELECTOR
+            pygame.display.set_caption("Game Selection")
+            self.selector._changed = True  # Show the selector again.
+        else:
+            # Shift to `game` keybindings otherwise.
+            self.game.handle_events(key, state)
     
     class Selector:
         """ Mechanics for game selection, previews, and high scores. """
@@ -114,7 +142,24 @@ class Brickgame(BaseClient):
                            }
             self.number_of_games = len(self.select)
             self.stage_id = 1  # Show `Snake` first.
-            self.name = self.select[self.stage_id].__class__.__name__
+            self.names = {stage_id: game.__class__.__name__
+                          for stage_id, game in self.select.items()}
+            self.name = self.names[self.stage_id]
+            self._screen_rect = pygame.Rect(0, 0, *RES)
+            # Whether the screen changed outside of `animate_screen`
+            # (starting with the initial background).
+            self._changed = True
+            # Preview frames of each game (`stage_id`:frames), found in
+            # `GamePreview` by the game's name, from `<name>1` to
+            # `<name>3`. Games without all three show no preview.
+            self._frames = {}
+            for stage_id, name in self.names.items():
+                frames = tuple(getattr(GamePreview, name + str(k), None)
+                               for k in (1, 2, 3))
+                if None not in frames:
+                    self._frames[stage_id] = frames
+            # Phases at 0.000s, 0.333s, and 0.666s (`t % FPS`:phase).
+            self._phases = {0: 0, int(FPS/3): 1, int(2*FPS/3): 2}
         
         def handle_events(self, key, state):
             """
@@ -132,9 +177,9 @@ class Brickgame(BaseClient):
                 if key == K_RETURN:
                     # Entering a game.
                     if self.stage_id <= self.number_of_games:
-                        Brickgame.environment = "game"
+                        Brickgame.environment = ENV_GAME
                         Brickgame.game = self.select[self.stage_id]
-                        self.name = Brickgame.game.__class__.__name__
+                        self.name = self.names[self.stage_id]
                         # Update the window title and inform of the
                         # game change.
                         pygame.display.set_caption(self.name)
@@ -143,10 +188,13 @@ class Brickgame(BaseClient):
                         # twice after endgames.
                         if not Brickgame.game.running:
                             Brickgame.game.reset()
+                        # Cover the selector with the game's screen.
+                        Brickgame.game.redraw()
                         #if self.name == "Tetris":
                         #    Brickgame.game.piece.preview()
                 # Choosing a game.
                 elif key == K_LEFT:
+                    self._changed = True
                     if self.stage_id > 1:
                         if self.stage_id > self.number_of_games:
                             pygame.display.set_caption("Game Selection")
@@ -155,6 +203,7 @@ class Brickgame(BaseClient):
                         self.stage_id = self.number_of_games+1
                         show_high_scores()
                 elif key == K_RIGHT:
+                    self._changed = True
                     if self.stage_id <= self.number_of_games:
                         self.stage_id += 1
                         if self.stage_id > self.number_of_games:
@@ -175,35 +224,24 @@ class Brickgame(BaseClient):
             ----------
             t : int
                 Main timer.
+
+            Returns
+            -------
+            list[pygame.Rect]
+                The areas of the screen that changed since the last call.
             """
 
-            if t % FPS == 0:  # 0.000s
-                if self.stage_id == 1:
-                    GamePreview.Snake1()
-                elif self.stage_id == 2:
-                    GamePreview.Breakout1()
-                elif self.stage_id == 3:
-                    GamePreview.Asteroids1()
-                elif self.stage_id == 4:
-                    GamePreview.Tetris1()
-            elif t % FPS == int(FPS/3):  # 0.333s
-                if self.stage_id == 1:
-                    GamePreview.Snake2()
-                elif self.stage_id == 2:
-                    GamePreview.Breakout2()
-                elif self.stage_id == 3:
-                    GamePreview.Asteroids2()
-                elif self.stage_id == 4:
-                    GamePreview.Tetris2()
-            elif t % FPS == int(2*FPS/3):  # 0.666s
-                if self.stage_id == 1:
-                    GamePreview.Snake3()
-                elif self.stage_id == 2:
-                    GamePreview.Breakout3()
-                elif self.stage_id == 3:
-                    GamePreview.Asteroids3()
-                elif self.stage_id == 4:
-                    GamePreview.Tetris3()
+            phase = self._phases.get(t % FPS)
+            # The High Scores screen (past the last game) has no
+            # frames, it is static.
+            frames = self._frames.get(self.stage_id)
+            if phase is not None and frames is not None:
+                frames[phase]()
+                self._changed = True
+            if self._changed:
+                self._changed = False
+                return [self._screen_rect]
+            return []
 
 
 def main():
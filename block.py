@@ -5,10 +5,19 @@ from .constants import *
 
 __all__ = ["Block", "BlinkingBlock", "Bomb"]
 
+_BOMB_CELLS = tuple((a, b) for a in range(4) for b in range(4))
+""" Offsets of the cells covered by a `Bomb` from its top left corner. """
+_DISPLACEMENTS = {direction: (i*DIST_BLOCKS, j*DIST_BLOCKS)
+                  for direction, (i, j) in CONVERT.items()}
+""" Pixel displacement of a `Block` moving in each direction. """
+
 
 class Block(pygame.sprite.Sprite):
     """ Unitary cell, colored black when active. """
 
+    _image_cache = {}
+    """ Drawn `image` surfaces, shared by all instances (color:surface). """
+
     def __init__(self, i, j, color=LINE_COLOR, direction=""):
         """
         Constructor for :class:`Block` instances.
@@ -38,19 +47,52 @@ class Block(pygame.sprite.Sprite):
         self.coords = (i, j)
         self._color = color
         self._direction = direction
+        # Frames between moves, and the speed it was computed from.
+        self._period = 1
+        self._speed = 0
 
         # Initialize the `Sprite`.
         super().__init__()
-        # Create an `image` surface and draw on it.
-        self.image = pygame.Surface((BLOCK_SIDE, BLOCK_SIDE))
-        self.image.fill(BACK_COLOR)
-        self.draw(self.image)
-        # Extract its `rect` container.
-        self.rect = self.image.get_rect()
-        # Place it according to i and j.
-        self.set_position(i, j)
-        self.set_direction(self._direction)
+        # Reuse the `image` surface drawn for this color, if any.
+        self.image = (Block._image_cache.get(color)
+                      or self._build_image(color))
+        # Build its `rect` container already placed according to i and j.
+        self.rect = pygame.Rect(BORDER_WIDTH + i*DIST_BLOCKS,
+                                BORDER_WIDTH + j*DIST_BLOCKS,
+                                BLOCK_SIDE,
+                                BLOCK_SIDE,
+                                )
+        if direction:
+            self.set_direction(direction)
     
+    @classmethod
+    def _build_image(cls, color):
+        """
+        Draw and cache the `image` surface for ``color``.
+
+        Parameters
+        ----------
+        color : tuple[int, int, int]
+            Color value.
+
+        Returns
+        -------
+        pygame.Surface
+            The drawn surface, shared by every `Block` with ``color``
+            once the display is set.
+        """
+
+        image = pygame.Surface((BLOCK_SIDE, BLOCK_SIDE))
+        image.fill(BACK_COLOR)
+        Block._draw_squares(image, color)
+        # Match the display's pixel format for faster blits. Before
+        # the display exists, don't cache, so the converted surface can
+        # be built later.
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+            Block._image_cache[color] = image
+        return image
+
     def update(self, t=0, speed=0):
         """
         Update the inner :class:`Block` mechanics.
@@ -66,15 +108,18 @@ class Block(pygame.sprite.Sprite):
         # The `Block` moves only when a direction and a positive speed
         # are specified.
         if self._direction and speed > 0:
-            if t % int(FPS/speed) == 0:  # `speed` actions per second.
+            # Compute the period again only when the speed changes.
+            if speed != self._speed:
+                self._speed = speed
+                self._period = int(FPS/speed)
+            if t % self._period == 0:  # `speed` actions per second.
                 # Move in place by `displacement`.
                 self.rect.move_ip(self.displacement)
-                # Adjust the coordinates.
+                # Adjust the coordinates (`displacement` is always a
+                # multiple of `DIST_BLOCKS`).
                 i, j = self.coords
                 a, b = self.displacement
-                a /= DIST_BLOCKS
-                b /= DIST_BLOCKS
-                self.coords = (i+int(a), j+int(b))
+                self.coords = (i + a//DIST_BLOCKS, j + b//DIST_BLOCKS)
     
     def draw(self, surface):
         """
@@ -86,19 +131,31 @@ class Block(pygame.sprite.Sprite):
             Environment to draw on.
         """
 
+        self._draw_squares(surface, self._color)
+
+    @staticmethod
+    def _draw_squares(surface, color):
+        """
+        Draw the outer and inner squares of a `Block` at ``surface``.
+
+        Parameters
+        ----------
+        surface : pygame.Surface
+            Environment to draw on.
+        color : tuple[int, int, int]
+            Color value.
+        """
+
         # Outer square
         side = PIXEL_SIDE*10
         square = pygame.Rect(0, 0, side, side)
-        pygame.draw.rect(surface, self._color, square, PIXEL_SIDE)
+        pygame.draw.rect(surface, color, square, PIXEL_SIDE)
 
         # Inner square
         dist = 2*PIXEL_SIDE
         side = 6*PIXEL_SIDE
         square = pygame.Rect(dist, dist, side, side)
-        pygame.draw.rect(surface, self._color, square)
-
-        # Update ``surface``.
-        surface.blit(surface, (0, 0))
+        pygame.draw.rect(surface, color, square)
     
     def set_position(self, i, j):
         """
@@ -114,9 +171,8 @@ class Block(pygame.sprite.Sprite):
 
         # Convert grid coordinates into positional pixels
         self.coords = (i, j)
-        x = int(BORDER_WIDTH + i*DIST_BLOCKS)
-        y = int(BORDER_WIDTH + j*DIST_BLOCKS)
-        self.rect.topleft = (x, y)  # Placement.
+        self.rect.topleft = (BORDER_WIDTH + i*DIST_BLOCKS,  # Placement.
+                             BORDER_WIDTH + j*DIST_BLOCKS)
     
     def set_direction(self, direction):
         """
@@ -131,10 +187,7 @@ class Block(pygame.sprite.Sprite):
 
         if direction:
             self._direction = direction
-            i, j = CONVERT[direction]
-            x = i*DIST_BLOCKS
-            y = j*DIST_BLOCKS
-            self.displacement = (x, y)
+            self.displacement = _DISPLACEMENTS[direction]
 
 
 class BlinkingBlock(Block):
@@ -158,8 +211,9 @@ class BlinkingBlock(Block):
         super().__init__(i, j)
         # Store the active `image` into `_image`.
         self._image = self.image
-        # Draw a shaded `blank` image.
-        self._blank = Block(i, j, color=SHADE_COLOR).image
+        # Take the shaded `blank` image.
+        self._blank = (Block._image_cache.get(SHADE_COLOR)
+                       or self._build_image(SHADE_COLOR))
     
     def update(self, t=0, **kwargs):
         """
@@ -191,6 +245,7 @@ class Bomb:
     """
 
     _bombs = []  # List of active `Bomb`s, shared within the objects.
+    _origins = []  # Top left corners of `_bombs`, in the same order.
 
     def __init__(self, i, j, group=None):
         """
@@ -233,6 +288,7 @@ class Bomb:
             group.add(*bomb)
             # Add ``bomb`` to `Bomb._bombs` for iteration.
             Bomb._bombs.append(bomb)
+            Bomb._origins.append((i, j))
     
     def move(self, direction):
         """
@@ -245,21 +301,26 @@ class Bomb:
         """
 
         a, b = CONVERT[direction]
-        for bomb in Bomb._bombs[::-1]:
+        bombs, origins = Bomb._bombs, Bomb._origins
+        for index in range(len(bombs)-1, -1, -1):
+            bomb = bombs[index]
+            i, j = origins[index]
+            k = j+b
+            origins[index] = (i+a, k)
             # Move each component using `.set_position()`.
             for block in bomb:
                 i, j = block.coords
                 block.set_position(i+a, j+b)
             
             # Delete a `Bomb` when it exits the grid.
-            _, k = bomb[0].coords
             if (direction == "up" and k < 0  # At the top.
                     or direction == "down" and k >= 17):  # At the bottom.
                 for block in bomb:
                     # Erase the drawings.
                     block.kill()
                 # Remove references.
-                Bomb._bombs.remove(bomb)
+                del bombs[index]
+                del origins[index]
     
     def check_explosion(self, target_group):
         """
@@ -277,20 +338,20 @@ class Bomb:
         """
 
         _erase = False
-        # Iterate through `Bomb._bombs` reversely, keeping track of the
-        # indexes for deletions.
-        for index, bomb in list(enumerate(Bomb._bombs))[::-1]:
-            i, j = bomb[0].coords
-            erase = False
-            # Detect explosion.
-            for block in target_group:
-                a, b = block.coords
-                if (i <= a <= i+3) and (j <= b <= j+3):
-                    # Stop if any component of `target` reaches `Bomb`.
-                    erase = True
-                    _erase = True
-            if erase:  # If any explosion happened.
+        # Read the targets' coordinates once.
+        coords = {block.coords for block in target_group}
+        # Iterate through `Bomb._origins` reversely, keeping track of
+        # the indexes for deletions.
+        origins = Bomb._origins
+        for index in range(len(origins)-1, -1, -1):
+            i, j = origins[index]
+            # Detect explosion: any component of `target` reaching the
+            # `Bomb`'s cells.
+            if not coords.isdisjoint((i+a, j+b) for a, b in _BOMB_CELLS):
+                _erase = True
                 self.explode(target_group, index=index)
+                # Some targets were destroyed.
+                coords = {block.coords for block in target_group}
         return _erase
 
     def explode(self, target_group, index=-1):
@@ -306,7 +367,7 @@ class Bomb:
         """
 
         bomb = Bomb._bombs[index]
-        i, j = bomb[0].coords
+        i, j = Bomb._origins[index]
         # Destroy `target`.
         for target in target_group:
             a, b = target.coords
@@ -316,4 +377,6 @@ class Bomb:
         # Destroy `bomb`.
         for block in bomb:
             block.kill()  # Erase the drawings.
-        del Bomb._bombs[index]  # Remove references.
+        # Remove references.
+        del Bomb._bombs[index]
+        del Bomb._origins[index]
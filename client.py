@@ -1,6 +1,7 @@
 """ Establishing the basic structure of the client. """
 
 import os
+import json
 import pygame
 from pygame.locals import *
 from abc import ABC
@@ -16,7 +17,74 @@ high_scores_dir = os.path.join(
 )
 """ Directory of `high-scores.json`. """
 
-__all__ = ["BaseClient", "package_dir", "high_scores_dir"]
+__all__ = ["BaseClient",
+           "package_dir",
+           "high_scores_dir",
+           "load_high_scores",
+           "save_high_scores",
+           ]
+
+_EVENT_TYPES = (KEYDOWN, KEYUP, QUIT, WINDOWEXPOSED)
+""" Event types let into the queue and read from it on each frame. """
+_MAX_STEPS = 5
+""" Most timer steps run in a single frame to catch up with the clock. """
+_high_scores = None
+""" Last read copy of `high-scores.json` (name:score), shared by all readers. """
+_high_scores_mtime = None
+""" Modification time of `high-scores.json` when it was last read. """
+
+
+def load_high_scores():
+    """
+    Read `high-scores.json`, again only when it has changed.
+
+    A file that can't be read or parsed is reported once and taken as
+    having no scores, until it changes.
+
+    Returns
+    -------
+    dict
+        The highest score of each game (name:score).
+    """
+
+    global _high_scores, _high_scores_mtime
+    try:
+        mtime = os.path.getmtime(high_scores_dir)
+    except OSError:
+        mtime = None  # Missing, `open` below reports it.
+    if _high_scores is None or mtime != _high_scores_mtime:
+        _high_scores_mtime = mtime
+        try:
+            # Extract from the .json file.
+            with open(high_scores_dir, "r") as file:
+                _high_scores = json.load(file)
+        except (OSError, ValueError) as e:
+            print(e)
+            print("Failed to read 'high-scores.json'.")
+            _high_scores = {}
+    return _high_scores
+
+
+def save_high_scores(high_scores):
+    """
+    Write ``high_scores`` to `high-scores.json`, keeping it as the
+    last read copy.
+
+    Parameters
+    ----------
+    high_scores : dict
+        The highest score of each game (name:score).
+    """
+
+    global _high_scores, _high_scores_mtime
+    # Write to a temporary file first, so an interrupted write can't
+    # leave a truncated `high-scores.json` behind.
+    temp_dir = high_scores_dir + ".tmp"
+    with open(temp_dir, "w") as file:
+        json.dump(high_scores, file)
+    os.replace(temp_dir, high_scores_dir)
+    _high_scores = high_scores
+    _high_scores_mtime = os.path.getmtime(high_scores_dir)
 
 
 class BaseClient(ABC):
@@ -31,6 +99,9 @@ class BaseClient(ABC):
         self.screen = pygame.display.set_mode(RES)  # Surface object.
         self.screen.fill(BACK_COLOR)
         pygame.mouse.set_visible(0)   # Hiding the cursor.
+        # Keep only the input the clients handle out of the queue.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_EVENT_TYPES)
 
     def _loop(self):
         """ A hidden method avoids interference. """
@@ -38,35 +109,76 @@ class BaseClient(ABC):
         # Start the timer.
         t = 0
         clock = pygame.time.Clock()
+        # Bind the per-frame calls to locals, keeping the loop tight.
+        tick = clock.tick
+        get_ticks = pygame.time.get_ticks
+        handle_events = self._handle_events
+        loop = self.loop
+        flip = pygame.display.flip
+        update = pygame.display.update
+        fps = FPS
+        tick_rate = TICK_RATE
+        max_steps = _MAX_STEPS
+        start = get_ticks()
         while self._run:
-            t += 1
             # Set the frame rate.
-            clock.tick(FPS)
+            tick(fps)
             # Read user input.
-            self._handle_events()
-            # Extra schedules.
-            self.loop(t)
-            # Update the screen.
-            pygame.display.flip()
+            handle_events()
+            # The timer follows the wall clock, advancing once every
+            # `TICK_RATE` milliseconds. Slow frames run the steps they
+            # missed, so every value of `t` is seen and no scheduled
+            # event is skipped. `loop` both updates and draws, so the
+            # drawing of all but the last step is painted over before
+            # the display is updated.
+            elapsed = (get_ticks() - start) // tick_rate
+            if elapsed - t > max_steps:
+                # After a long stall, move the start forward rather
+                # than `t`, so the game pauses instead of rushing.
+                start += (elapsed - t - max_steps)*tick_rate
+                elapsed = t + max_steps
+            full_update = False
+            rects = []
+            while t < elapsed:
+                t += 1
+                # Extra schedules.
+                changed = loop(t)
+                if changed is None:
+                    full_update = True
+                else:
+                    rects.extend(changed)
+            # Update the screen: entirely, or only the areas reported
+            # as changed by `loop`.
+            if full_update:
+                flip()
+            elif rects:
+                update(rects)
 
     def _handle_events(self):
         """ Set up the structure for input events. """
 
-        # Open a queue of events.
+        # Drain the whole queue in a single batch. (Filtering by type
+        # in `get()` would regroup the events and break the
+        # press/release order.)
         for event in pygame.event.get():
             state = event.type
-            # Key press and release.
-            if state in (KEYDOWN, KEYUP):
-                key = event.key
+            if state not in _EVENT_TYPES:
+                continue
             # Window exit conditions.
             if state == QUIT:  # Closing directly.
                 self._run = False
-            elif state == KEYDOWN:
-                if key == K_ESCAPE:  # Pressing ESC.
-                    self._run = False
+                continue
+            # The window was uncovered or restored: show the whole
+            # screen again, since idle frames don't update it.
+            if state == WINDOWEXPOSED:
+                pygame.display.flip()
+                continue
+            # Key press and release.
+            key = event.key
+            if state == KEYDOWN and key == K_ESCAPE:  # Pressing ESC.
+                self._run = False
             # If a key is pressed or released, switch to the standard.
-            if state in (KEYDOWN, KEYUP):
-                self.handle_events(key, state)
+            self.handle_events(key, state)
 
     def start(self):
         """ Allow for more definition before starting the main loop. """
@@ -74,7 +186,20 @@ class BaseClient(ABC):
         self._loop()
 
     def loop(self, t):
-        """ Schedule loop events. """
+        """
+        Schedule loop events.
+
+        Parameters
+        ----------
+        t : int
+            A timer.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            The areas of the screen changed in this frame, or ``None``
+            to update the whole screen.
+        """
 
         pass
 
@@ -38,3 +38,6 @@ BORDER_WIDTH = int(WINDOW_WIDTH/111)
 # Time handling.
 TICK_RATE = 16  # Minimum time interval, in milliseconds.
 FPS = int(1000/TICK_RATE)  # Approx. 60 when `TICK_RATE` is 16.
+
+# Client environments.
+ENV_SELECTOR, ENV_GAME = 0, 1
@@ -28,20 +28,31 @@ class Asteroids(Game):
     """
 
     shooter_speed = 10
-    entities = {"asteroids": pygame.sprite.RenderPlain(),
-                "bullet":    pygame.sprite.RenderPlain(),
-                "shooter":   pygame.sprite.RenderPlain(),
-                "bomb":      pygame.sprite.RenderPlain()}
     
     def __init__(self):
 
         super().__init__()
+        # Containers owned by this game, so nothing outlives it.
+        self.entities = {"asteroids": pygame.sprite.RenderPlain(),
+                         "bullet":    pygame.sprite.RenderPlain(),
+                         "shooter":   pygame.sprite.RenderPlain(),
+                         "bomb":      pygame.sprite.RenderPlain()}
+        self._asteroids_group = self.entities["asteroids"]
+        self._bullet_group = self.entities["bullet"]
+        self._shooter_group = self.entities["shooter"]
+        self._bomb_group = self.entities["bomb"]
         self.asteroids_speed = 2  # Falling speed.
         self.speed = self.asteroids_speed
         self.game_ticks = 0  # Internal timer for the game.
+        # Frames between actions of the asteroids and of the shooter.
+        self._asteroids_period = int(FPS/self.asteroids_speed)
+        self._shooter_period = int(FPS/self.shooter_speed)
+        self._max_row = 0
+        """ Lowest row holding an asteroid (0 if there are none). """
 
         # Spawn the entities.
-        self.shooter = self.Shooter()  # Also spawns the bullets.
+        # The `shooter` also spawns the bullets.
+        self.shooter = self.Shooter(self._shooter_group, self._bullet_group)
         # Initialize `self.bomb` with a dummy `Bomb` outside the grid.
         self.bomb = Bomb(-5, -5)
 
@@ -61,17 +72,17 @@ class Asteroids(Game):
 
         if self.running:
             if state == KEYDOWN:  # Key pressed.
-                # Set `Shooter`'s movement.
+                # Set `shooter`'s movement.
                 if key == K_LEFT:
-                    self.Shooter.direction = "left"
+                    self.shooter.dx, _ = CONVERT["left"]
                 elif key == K_RIGHT:
-                    self.Shooter.direction = "right"
+                    self.shooter.dx, _ = CONVERT["right"]
 
             if state == KEYUP:  # Key released.
                 if key == K_LEFT:
-                    self.Shooter.direction = ""
+                    self.shooter.dx = 0
                 elif key == K_RIGHT:
-                    self.Shooter.direction = ""
+                    self.shooter.dx = 0
     
     def manage(self, t):
         """
@@ -90,20 +101,23 @@ class Asteroids(Game):
 
             # Manage multiple simultaneous hits and scoring.
             collisions = self.check_hit()
+            if collisions:
+                self.track_lowest_row()
             self.update_score(len(collisions))
 
             # Set the events with an action rate of `asteroids_speed`
             # `Block`s per second.
-            if t % int(FPS/self.asteroids_speed) == 0:
+            if t % self._asteroids_period == 0:
                 self.move_asteroids(self.game_ticks)
                 self.bomb.move("up")
-                self.bomb.check_explosion(
-                    target_group=Asteroids.entities["asteroids"]
-                )
+                n = len(self._asteroids_group)
+                self.bomb.check_explosion(target_group=self._asteroids_group)
+                if len(self._asteroids_group) < n:
+                    self.track_lowest_row()
 
             # Set the events with an action rate of `shooter_speed`
             # `Block`s per second.
-            if t % int(FPS/self.shooter_speed) == 0:
+            if t % self._shooter_period == 0:
                 # The `Bullet`'s movement is handled by its `update`
                 # method.
                 self.shooter.shoot()
@@ -122,15 +136,22 @@ class Asteroids(Game):
             A mapping with all the collisions.
         """
 
-        asteroids = self.entities["asteroids"]
-        bullet = self.entities["bullet"]
-        # A collision happens if the sprites overlap.
-        collisions = pygame.sprite.groupcollide(
-            asteroids,
-            bullet,
-            dokilla=True,  # Destroy asteroids.
-            dokillb=True,  # Destroy bullet.
-        )
+        # All the sprites are single `Block`s on the grid, so they
+        # overlap exactly when they share coordinates. Bucket the
+        # bullets by cell once instead of testing every pair of rects.
+        bullets = {}
+        for bullet in self._bullet_group:
+            bullets.setdefault(bullet.coords, []).append(bullet)
+        collisions = {}
+        for asteroid in self._asteroids_group:
+            # Each bullet is used up by the first asteroid it hits.
+            hit = bullets.pop(asteroid.coords, None)
+            if hit:
+                collisions[asteroid] = hit
+                # Destroy asteroids and bullets.
+                asteroid.kill()
+                for bullet in hit:
+                    bullet.kill()
         return collisions
 
     def update_score(self, blocks_hit):
@@ -154,15 +175,13 @@ class Asteroids(Game):
         spawn_rate = 1/3000
         if t <= 180*FPS and t % (60*FPS) == 0:
             spawn_rate += 1/6000
-        (spawning,) = random.choices(
-            (USE_BOMBS, False),  # No spawns if `USE_BOMBS` is False.
-            (spawn_rate, 1-spawn_rate),
-        )
+        # No spawns if `USE_BOMBS` is False.
+        spawning = USE_BOMBS and random.random() < spawn_rate
         # It shall spawn at the bottom of the grid with a random
         # horizontal coordinate.
         if spawning:
             i = random.randint(0, 6)
-            self.bomb = Bomb(i, 19, group=self.entities["bomb"])
+            self.bomb = Bomb(i, 19, group=self._bomb_group)
     
     def check_victory(self):
         """
@@ -188,14 +207,19 @@ class Asteroids(Game):
             Whether the game was lost.
         """
 
-        asteroids = self.entities["asteroids"]
-        shooter = self.entities["shooter"]
+        asteroids = self._asteroids_group
+        shooter = self._shooter_group
         # Check for collisions with the `shooter`.
         collision = pygame.sprite.groupcollide(asteroids, shooter, 0, 0)
-        # Track the asteroids' height.
-        distance = max([1] + [asteroid.coords[1] for asteroid in asteroids])
         
-        return bool(collision) or distance >= 20  # Hitting the bottom.
+        return bool(collision) or self._max_row >= 20  # Hitting the bottom.
+
+    def track_lowest_row(self):
+        """ Recompute the asteroids' height after some were destroyed. """
+
+        self._max_row = max((asteroid.coords[1]
+                             for asteroid in self._asteroids_group),
+                            default=0)
 
     def move_asteroids(self, t):
         """
@@ -207,9 +231,16 @@ class Asteroids(Game):
             The timer.
         """
 
-        for asteroid in Asteroids.entities["asteroids"]:
+        # Shift every asteroid one row down, moving the `rect`s in
+        # place instead of recomputing them from the grid coordinates.
+        asteroids = self._asteroids_group
+        for asteroid in asteroids:
             i, j = asteroid.coords
-            asteroid.set_position(i, j + 1)
+            asteroid.coords = (i, j + 1)
+            asteroid.rect.move_ip(0, DIST_BLOCKS)
+        # The lowest asteroid went down along with the others.
+        if asteroids:
+            self._max_row += 1
 
         # Spawn rate starts at 0.3 per tick, increasing linearly up to
         # 0.45 per tick after 3 minutes. (>=0.5 is unbeatable.)
@@ -217,17 +248,44 @@ class Asteroids(Game):
             r = 0.3 + t * 0.15 / (180 * FPS)
         else:
             r = 0.45
-        choices = random.choices((1, 0), (r, 1 - r), k=10)
-        for i, choice in enumerate(choices):
-            if choice:
-                Asteroids.entities["asteroids"].add(Block(i, 0))
+        for i in range(10):
+            if random.random() < r:
+                asteroids.add(Block(i, 0))
 
     class Bullet(Block):
-        """ A `Block` sprite that moves up. """
+        """
+        A `Block` sprite that moves up.
+
+        Once killed, it goes back to its ``pool`` to be shot again.
+        """
+
+        def __init__(self, i, j, group, pool):
+            """
+            Spawn a `Bullet` moving up from a cell.
+
+            Parameters
+            ----------
+            i : int
+                Horizontal position on the grid.
+            j : int
+                Vertical position on the grid.
+            group : pygame.sprite.Group
+                The game's container for the bullets.
+            pool : list[Asteroids.Bullet]
+                Where the `Bullet` is stored for reuse when killed.
+            """
 
-        def __init__(self, i, j):
             super().__init__(i, j, direction="up")
-            Asteroids.entities["bullet"].add(self)
+            self._pool = pool
+            group.add(self)
+
+        def kill(self):
+            """ Remove the `Bullet` from its groups and store it for reuse. """
+
+            # Guard against a second `kill` storing it twice.
+            if self.alive():
+                super().kill()
+                self._pool.append(self)
         
         def update(self, speed, **kwargs):
             """
@@ -255,30 +313,49 @@ class Asteroids(Game):
 
         Attributes
         ----------
-        direction : str
-            Where to move: ``"left"`` or ``"right"``.
+        dx : int
+            Horizontal step per move: ``-1`` (left), ``0``, or ``1``
+            (right).
         """
-
-        direction = ""
         
-        def __init__(self):
-            """ Set `Shooter`'s initial position """
+        def __init__(self, group, bullet_group):
+            """
+            Set `Shooter`'s initial position.
+
+            Parameters
+            ----------
+            group : pygame.sprite.Group
+                The game's container for the shooter.
+            bullet_group : pygame.sprite.Group
+                The game's container for the bullets it shoots.
+            """
 
             super().__init__(4, 19)
-            Asteroids.entities["shooter"].add(self)
+            self.dx = 0  # Standing still.
+            self._bullet_group = bullet_group
+            self._bullet_pool = []  # Killed `Bullet`s, ready to reuse.
+            group.add(self)
         
         def move(self):
             """ Avoid the shooter from leaving the grid. """
 
             i, j = self.coords
-            a, _ = CONVERT[Asteroids.Shooter.direction]
-            if 0 <= i+a < 10:
+            a = self.dx
+            if a and 0 <= i+a < 10:
                 self.set_position(i+a, j)
         
         def shoot(self):
-            """ Spawn the `Bullet`. """
-
-            Asteroids.Bullet(*self.coords)
+            """ Spawn the `Bullet`, reusing a killed one if possible. """
+
+            if self._bullet_pool:
+                bullet = self._bullet_pool.pop()
+                bullet.set_position(*self.coords)
+                self._bullet_group.add(bullet)
+            else:
+                Asteroids.Bullet(*self.coords,
+                                 group=self._bullet_group,
+                                 pool=self._bullet_pool,
+                                 )
         
         def update(self, speed, **kwargs):
             """
@@ -313,6 +390,11 @@ class Client(BaseClient):
         ----------
         t : int
             A timer.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            The areas of the screen to update (all of it with ``None``).
         """
 
         # Update `Block`'s mechanics.
@@ -322,7 +404,7 @@ class Client(BaseClient):
         self.game.manage(t)
 
         # Draw the game objects to the screen.
-        self.game.draw_entities()
+        return self.game.draw_entities()
 
     def handle_events(self, key, state):
         """
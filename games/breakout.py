@@ -11,6 +11,134 @@ from .game_engine import Game
 __doc__ = "".join([__doc__, "\n\nCheck `", game_manuals, "` for instructions."])
 __all__ = ["Breakout"]
 
+_DISP = {(a, b): (a*DIST_BLOCKS, b*DIST_BLOCKS)
+         for a in (-1, 0, 1) for b in (-1, 0, 1)}
+""" Pixel displacement of the ball for each velocity. """
+
+_LEVEL_SKETCHES = {
+    1: {0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        1: (0,                         9),
+        2: (0,                         9),
+        3: (0,       3, 4, 5, 6,       9),
+        4: (0,       3, 4, 5, 6,       9),
+        5: (0,       3, 4, 5, 6,       9),
+        6: (0,       3, 4, 5, 6,       9),
+        7: (0,                         9),
+        8: (0,                         9),
+        9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)},
+    2: {0: (0, 1,                   8, 9),
+        1: (0, 1, 2,             7, 8, 9),
+        2: (   1, 2, 3,       6, 7, 8   ),
+        3: (      2, 3, 4, 5, 6, 7      ),
+        4: (   1, 2, 3,       6, 7, 8   ),
+        5: (0, 1, 2,             7, 8, 9),
+        6: (0, 1,                   8, 9)},
+    3: {0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        1: (0,          4, 5,          9),
+        2: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        3: (0,          4, 5,          9),
+        4: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        5: (0,          4, 5,          9),
+        6: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)},
+}
+"""
+The horizontal positions of the target `Block`s in each line of each
+stage (stage:{line:positions}).
+"""
+
+# Template for more stages
+#
+#   4: {0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       1: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       2: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       3: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       4: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       5: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       6: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       7: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       8: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+#       9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)},
+
+_LEVEL_CELLS = {level: tuple((i, j)
+                             for j, line in sketch.items() for i in line)
+                for level, sketch in _LEVEL_SKETCHES.items()}
+""" Flattened `_LEVEL_SKETCHES`: the cells of each stage's `Block`s. """
+
+
+def _cell_bit(i, j):
+    """
+    Bit flag of a grid cell in a `Breakout.Target.grid` bitmask.
+
+    Parameters
+    ----------
+    i : int
+        Horizontal position on the grid.
+    j : int
+        Vertical position on the grid.
+
+    Returns
+    -------
+    int
+        ``1 << (j*10 + i)``, or 0 for cells outside the grid.
+    """
+
+    if 0 <= i < 10 and 0 <= j < 20:
+        return 1 << (j*10 + i)
+    return 0
+
+
+def _resolve_hit(grid, i, j, a, b):
+    """
+    Collision arithmetic between a ball and the target's bitmask.
+
+    Parameters
+    ----------
+    grid : int
+        Bitmask of the cells holding a target `Block`.
+    i : int
+        Horizontal position of the ball.
+    j : int
+        Vertical position of the ball.
+    a : int
+        Horizontal velocity of the ball.
+    b : int
+        Vertical velocity of the ball.
+
+    Returns
+    -------
+    list[int] or None
+        The ball's new velocity, or ``None`` if it hit nothing.
+    tuple[tuple[int, int], ...]
+        Cells of the target `Block`s to destroy.
+    """
+
+    # Neighbouring cells in the ball's path.
+    side = grid & _cell_bit(i+a, j)
+    front = grid & _cell_bit(i, j+b)
+
+    # When the ball hits a corner between two target Blocks, reverse
+    # both directions and destroy both `Block`s that make the corner,
+    # including the vertex, if it exists.
+    if side and front:
+        if grid & _cell_bit(i+a, j+b):
+            return [-a, -b], ((i+a, j), (i, j+b), (i+a, j+b))
+        return [-a, -b], ((i+a, j), (i, j+b))
+    # When the ball hits the target's `Block`s horizontally only,
+    # reverse only its first coordinate and destroy only the `Block`
+    # it hit.
+    if side:
+        return [-a, b], ((i+a, j),)
+    # When the ball hits the target's `Block`s vertically only,
+    # reverse only its second coordinate and destroy only the `Block`
+    # it hit.
+    if front:
+        return [a, -b], ((i, j+b),)
+    # When the ball hits the target's `Block`s at exactly a vertex,
+    # reverse both directions and destroy the `Block` at said vertex.
+    if grid & _cell_bit(i+a, j+b):
+        return [-a, -b], ((i+a, j+b),)
+    return None, ()
+
 
 class Breakout(Game):
     """
@@ -31,22 +159,27 @@ class Breakout(Game):
     number = 0
     start_speed = 15
     speeds = (start_speed, 2*start_speed)
-    entities = {"target": pygame.sprite.RenderPlain(),
-                "ball":   pygame.sprite.RenderPlain(),
-                "paddle": pygame.sprite.RenderPlain(),
-                }
     
     def __init__(self):
         """ Initialize instance attributes and instantiate game objects. """
 
         super().__init__()
+        # Containers owned by this game, so nothing outlives it.
+        self.entities = {"target": pygame.sprite.RenderPlain(),
+                         "ball":   pygame.sprite.RenderPlain(),
+                         "paddle": pygame.sprite.RenderPlain(),
+                         }
+        self._target_group = self.entities["target"]
+        self._ball_group = self.entities["ball"]
+        self._paddle_group = self.entities["paddle"]
         self.level = 1  # Starting stage.
         self.speed = Breakout.start_speed  # Internal speed for `ball`.
+        self.action_period = int(FPS/self.speed)  # Frames between actions.
 
         # Spawn the entities.
-        self.target = self.Target(self.level)
-        self.ball = self.Ball(4, 18)
-        self.paddle = self.Paddle(self.ball)
+        self.target = self.Target(self.level, self._target_group)
+        self.ball = self.Ball(4, 18, self._ball_group)
+        self.paddle = self.Paddle(self.ball, self._paddle_group)
     
     def handle_events(self, key, state):
         """
@@ -64,26 +197,31 @@ class Breakout(Game):
 
         if self.running:
             if state == KEYDOWN:  # Key pressed.
-                # Set `Paddle`'s movement.
+                # Set `paddle`'s movement.
                 if key == K_LEFT:
-                    self.Paddle.direction = "left"
+                    self.paddle.dx, _ = CONVERT["left"]
                 elif key == K_RIGHT:
-                    self.Paddle.direction = "right"
+                    self.paddle.dx, _ = CONVERT["right"]
                 elif key == K_SPACE:
                     self.speed = Breakout.speeds[1]
+                    self.action_period = int(FPS/self.speed)
 
             if state == KEYUP:  # Key released.
                 if key == K_LEFT:
-                    self.Paddle.direction = ""
+                    self.paddle.dx = 0
                 elif key == K_RIGHT:
-                    self.Paddle.direction = ""
+                    self.paddle.dx = 0
                 elif key == K_SPACE:
                     self.speed = Breakout.speeds[0]
+                    self.action_period = int(FPS/self.speed)
     
     def manage(self, t):
         """
         Game logic implementation.
 
+        Runs at the action rate of `speed` blocks per second: the
+        clients only call it every ``action_period`` frames.
+
         Parameters
         ----------
         t : int
@@ -91,40 +229,37 @@ class Breakout(Game):
         """
 
         if self.running and not self.paused:
-            # Set the action rate at `speed` blocks per second.
-            if t % int(FPS/self.speed) == 0:
-                # Check if the `ball` hit `target`.
-                self.target.check_hit(self.ball)
-                self.update_score()
-
-                # Check if there still are `Block`s left in `target`.
-                # If not, call the next stage.
-                self.manage_levels()
-
-                self.ball.check_border_reflect()
-                
-                # Deal with immediate collision after hitting a border.
-                self.target.check_hit(self.ball)
-                self.update_score()
-                self.manage_levels()
-
-                # `paddle` dragging `ball`.
-                self.paddle.check_paddle_drag()
-                self.paddle.check_paddle_reflect()
-
-                # Avoid the `ball` from leaving the screen by the
-                # lateral borders.
-                self.ball.check_border_reflect()
-
-                # Make the `paddle` move.
-                self.paddle.move(self.speed)
+            # Check if the `ball` hit `target`.
+            self.target.check_hit(self.ball)
+            self.update_score()
+
+            # Check if there still are `Block`s left in `target`.
+            # If not, call the next stage.
+            self.manage_levels()
+
+            self.ball.check_border_reflect()
+            
+            # Deal with immediate collision after hitting a border.
+            self.target.check_hit(self.ball)
+            self.update_score()
+            self.manage_levels()
+
+            # `paddle` dragging or reflecting `ball`.
+            self.paddle.handle_paddle_ball()
+
+            # Avoid the `ball` from leaving the screen by the
+            # lateral borders.
+            self.ball.check_border_reflect()
+
+            # Make the `paddle` move.
+            self.paddle.move(self.speed)
         
         super().manage()  # Manage endgame.
     
     def update_score(self):
         """ Scoring mechanics. """
 
-        n = len(Breakout.entities["target"].sprites())  # `target`'s `Block`s left.
+        n = len(self._target_group)  # `target`'s `Block`s left.
         for _ in range(Breakout.number, n, -1):
             if self.level == 1:
                 self.score += 15
@@ -138,20 +273,22 @@ class Breakout(Game):
     def manage_levels(self):
         """ Turns to the next stage upon clearing the current one. """
 
-        if self.level <= 3 and not Breakout.entities["target"]:
+        if self.level <= 3 and not self._target_group:
             # Toggle the next stage.
             print("Stage", self.level, "cleared")
             self.level += 1
             # Add score bonus from phase completion.
             self.score += 3000 + 3000*(self.level - 1)
             # Construct the next `target`.
-            self.target = self.Target(self.level)
+            self.target = self.Target(self.level, self._target_group)
             # Respawn the `ball`.
-            Breakout.entities["ball"].empty()
-            self.ball = self.Ball(4, 18)
-            # Respawn the `paddle`.
-            Breakout.entities["paddle"].empty()
-            self.paddle = self.Paddle(self.ball)
+            self._ball_group.empty()
+            self.ball = self.Ball(4, 18, self._ball_group)
+            # Respawn the `paddle`, still following the player's input.
+            dx = self.paddle.dx
+            self._paddle_group.empty()
+            self.paddle = self.Paddle(self.ball, self._paddle_group)
+            self.paddle.dx = dx
     
     def check_victory(self):
         """
@@ -184,8 +321,10 @@ class Breakout(Game):
         Organizes the drawing and breaking of the target `Block`s at
         the top of the grid.
         """
+
+        __slots__ = ("group", "block", "grid")
         
-        def __init__(self, level):
+        def __init__(self, level, group):
             """
             Build the target's structure.
 
@@ -193,70 +332,40 @@ class Breakout(Game):
             ----------
             level : int
                 Current stage.
+            group : pygame.sprite.Group
+                The game's container for the target `Block`s.
             """
             
+            self.group = group
             self.block = {}
+            self.grid = 0
+            """ Bitmask of the cells holding a `Block` (see `_cell_bit`). """
             
             # Clean the `target`'s drawing and references.
-            Breakout.entities["target"].empty()
-
-            if level == 1:
-                sketch = {0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                          1: (0,                         9),
-                          2: (0,                         9),
-                          3: (0,       3, 4, 5, 6,       9),
-                          4: (0,       3, 4, 5, 6,       9),
-                          5: (0,       3, 4, 5, 6,       9),
-                          6: (0,       3, 4, 5, 6,       9),
-                          7: (0,                         9),
-                          8: (0,                         9),
-                          9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)}
-                for j in sketch.keys():
-                    for i in sketch[j]:
-                        self.block[(i, j)] = Block(i, j)
-                        self.block[(i, j)].add(Breakout.entities["target"])
-
-            elif level == 2:
-                sketch = {0: (0, 1,                   8, 9),
-                          1: (0, 1, 2,             7, 8, 9),
-                          2: (   1, 2, 3,       6, 7, 8   ),
-                          3: (      2, 3, 4, 5, 6, 7      ),
-                          4: (   1, 2, 3,       6, 7, 8   ),
-                          5: (0, 1, 2,             7, 8, 9),
-                          6: (0, 1,                   8, 9)}
-                for j in sketch.keys():
-                    for i in sketch[j]:
-                        self.block[(i, j)] = Block(i, j)
-                        self.block[(i, j)].add(Breakout.entities["target"])
-
-            elif level == 3:
-                sketch = {0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                          1: (0,          4, 5,          9),
-                          2: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                          3: (0,          4, 5,          9),
-                          4: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                          5: (0,          4, 5,          9),
-                          6: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)}
-                for j in sketch.keys():
-                    for i in sketch[j]:
-                        self.block[(i, j)] = Block(i, j)
-                        self.block[(i, j)].add(Breakout.entities["target"])
+            self.group.empty()
+
+            # Spawn the stage's `Block`s (none after the last stage).
+            self.build(_LEVEL_CELLS.get(level, ()))
 
             Breakout._total = len(self.block) if level <= 3 else 1
             Breakout.number = Breakout._total
 
-            # Template for more stages
-            #
-            # sketch = {0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           1: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           2: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           3: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           4: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           5: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           6: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           7: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           8: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-            #           9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)}}
+        def build(self, cells):
+            """
+            Spawn the target `Block`s at ``cells``.
+
+            Parameters
+            ----------
+            cells : tuple[tuple[int, int], ...]
+                Positions of the `Block`s on the grid.
+            """
+
+            blocks = [Block(i, j) for (i, j) in cells]
+            self.block = {block.coords: block for block in blocks}
+            for (i, j) in self.block:
+                self.grid |= _cell_bit(i, j)
+            # Add them all to the container for drawing at once.
+            self.group.add(*blocks)
         
         def check_hit(self, ball):
             """
@@ -268,53 +377,32 @@ class Breakout(Game):
                 The ``Ball`` instance.
             """
 
-            a, b = ball.velocity
             i, j = ball.coords
-            
-            # When the `ball` hits a corner between two target Blocks...
-            if ((i+a, j) in self.block.keys()
-                    and (i, j+b) in self.block.keys()):
-                # ... reverse both directions, ...
-                ball.velocity = [-a, -b]
-                # ... destroy both `Block`s that make the corner, ...
-                self.block[(i+a, j)].kill()
-                self.block[(i, j+b)].kill()
-                del self.block[(i+a, j)]
-                del self.block[(i, j+b)]
-                # ... including the vertex, if it exists.
-                if (i+a, j+b) in self.block.keys():
-                    self.block[(i+a, j+b)].kill()
-                    del self.block[(i+a, j+b)]
-            
-            # When the `ball` hits the `target`'s `Block`s horizontally only...
-            elif ((i+a, j) in self.block.keys()
-                  and (i, j+b) not in self.block.keys()):
-                # ... reverse only its first coordinate, ...
-                ball.velocity = [-a, b]
-                # and destroy only the `Block` it hit.
-                self.block[(i+a, j)].kill()
-                del self.block[(i+a, j)]
-            
-            # When the `ball` hits the `target`'s `Block`s vertically only...
-            elif ((i+a, j) not in self.block.keys()
-                    and (i, j+b) in self.block.keys()):
-                # ... reverse only its second coordinate, ...
-                ball.velocity = [a, -b]
-                # ... and destroy only the `Block` it hit.
-                self.block[(i, j+b)].kill()
-                del self.block[(i, j+b)]
-            
-            # When the `ball` hits the `target`'s `Block`s at exactly a vertex...
-            elif (i+a, j+b) in self.block.keys():
-                # ... reverse both directions, ...
-                ball.velocity = [-a, -b]
-                # ... and destroy the `Block` at said vertex.
-                self.block[(i+a, j+b)].kill()
-                del self.block[(i+a, j+b)]
+            a, b = ball.velocity
+            velocity, cells = _resolve_hit(self.grid, i, j, a, b)
+            if velocity is not None:
+                ball.velocity = velocity
+            for cell in cells:
+                self.destroy(*cell)
 
             # Adjust from positional coordinates to the appropriate
             # number of pixels.
-            ball.displacement = [x*DIST_BLOCKS for x in ball.velocity]
+            ball.displacement = _DISP[tuple(ball.velocity)]
+
+        def destroy(self, i, j):
+            """
+            Erase the target `Block` at a cell and its references.
+
+            Parameters
+            ----------
+            i : int
+                Horizontal position on the grid.
+            j : int
+                Vertical position on the grid.
+            """
+
+            self.grid &= ~_cell_bit(i, j)
+            self.block.pop((i, j)).kill()
     
     class Paddle:
         """
@@ -325,16 +413,20 @@ class Breakout(Game):
 
         Attributes
         ----------
-        direction : str
-            Where to move: ``"left"`` or ``"right"``.
+        dx : int
+            Horizontal step per move: ``-1`` (left), ``0``, or ``1``
+            (right).
         dragging : bool
             Whether the paddle is currently dragging the ``ball``.
+        coords : tuple[tuple[int, int], ...]
+            Positions of the paddle's own `Block`s, left to right.
         """
 
-        direction = ""
+        __slots__ = ("ball", "group", "dx", "coords",
+                     "_blocks", "_size", "_i0", "_j", "_attached")
         dragging = False
         
-        def __init__(self, ball):
+        def __init__(self, ball, group):
             """
             Build the paddle (dragging the ``ball`` at start).
 
@@ -342,22 +434,61 @@ class Breakout(Game):
             ----------
             ball : Breakout.Ball
                 The ``Ball`` instance.
+            group : pygame.sprite.Group
+                The game's container for the paddle.
             """
 
             self.ball = ball
+            self.group = group
+            self.dx = 0  # Standing still.
             
             # Set the `paddle`'s initial position.
-            self.blocks = [Block(3, 19), Block(4, 19), Block(5, 19)]
-            self._size = len(self.blocks)
+            self._blocks = (Block(3, 19), Block(4, 19), Block(5, 19))
+            self._size = len(self._blocks)
+            # The `paddle` is a horizontal run of `Block`s at row `_j`,
+            # starting from column `_i0`.
+            self._i0, self._j = self._blocks[0].coords
 
-            # Add the `ball` to the `paddle` initially to allow for a
+            # Attach the `ball` to the `paddle` initially to allow for a
             # launching choice.
-            self.blocks.append(self.ball)
+            self._attached = True
 
             # Track coordinates and add to the corresponding `Group`
             # for drawing.
-            self.coords = [block.coords for block in self.blocks]
-            Breakout.entities["paddle"].add(*self.blocks)
+            self.coords = tuple(block.coords for block in self._blocks)
+            self.group.add(*self.blocks)
+
+        @property
+        def blocks(self):
+            """
+            The paddle's own `Block`s, followed by the ``ball`` while it
+            is attached to the paddle.
+
+            Returns
+            -------
+            tuple[Block, ...]
+            """
+
+            if self._attached:
+                return self._blocks + (self.ball,)
+            return self._blocks
+
+        def attach(self, attached):
+            """
+            Attach the ``ball`` to the paddle, or release it.
+
+            Parameters
+            ----------
+            attached : bool
+                Whether the ``ball`` should move along with the paddle.
+            """
+
+            if attached != self._attached:
+                self._attached = attached
+                if attached:
+                    self.group.add(self.ball)
+                else:
+                    self.group.remove(self.ball)
         
         def move(self, speed):
             """
@@ -371,85 +502,89 @@ class Breakout(Game):
 
             # Take a reference at the leftmost horizontal coordinate of
             # the `paddle`.
-            i_0 = self.coords[0][0]
-            a, _ = CONVERT[self.direction]  # Only horizontal matters.
-            for block in self.blocks:
-                i, j = block.coords
-                # Ensures the `paddle` will remain within the screen.
-                if 0 <= i_0+a <= 10-self._size:
+            i_0 = self._i0
+            a = self.dx
+            # Ensures the `paddle` will remain within the screen.
+            if a and 0 <= i_0+a <= 10-self._size:
+                for block in self.blocks:
+                    i, j = block.coords
                     block.set_position(i+a, j)
-
-            # Update the `paddle`'s coordinates.
-            self.coords = [block.coords for block in self.blocks]
+                # Update the `paddle`'s coordinates.
+                self._i0 = i_0+a
+                self.coords = tuple((i+a, j) for (i, j) in self.coords)
 
             # Launch mechanics at the start of the stage (the `ball` is
             # released from the `paddle` if *Space* is pressed).
             if speed > Breakout.start_speed:
                 # Stage start conditions.
-                if (len(self.coords) == self._size + 1
-                        and Breakout.number == Breakout._total):
-                    Breakout.entities["paddle"].remove(self.ball)
-                    self.blocks.pop()
-                    self.coords.pop()
+                if self._attached and Breakout.number == Breakout._total:
+                    self.attach(False)
                     # Update `ball` data.
                     self.ball._direction = "NE"
                     self.ball.velocity = [1, -1]  # First direction.
         
-        def check_paddle_drag(self):
-            """ Manages ``ball`` drag and release. """
+        def touches(self, i, j):
+            """
+            Whether a cell is part of the paddle.
+
+            Parameters
+            ----------
+            i : int
+                Horizontal position on the grid.
+            j : int
+                Vertical position on the grid.
+
+            Returns
+            -------
+            bool
+                Whether one of the paddle's own `Block`s is at ``(i, j)``.
+            """
+
+            return j == self._j and self._i0 <= i < self._i0 + self._size
+
+        def handle_paddle_ball(self):
+            """ Manages ``ball`` drag, release, and reflection off the paddle. """
+
+            ball = self.ball
+            i, j = ball.coords
+            a, b = ball.velocity
+            # Whether the `ball` is about to hit the `paddle` from the
+            # top, or at a vertex.
+            top = self.touches(i, j+b)
+            vertex = self.touches(i+a, j+b)
 
-            i, j = self.ball.coords
-            _, b = self.ball.velocity
             # Allow for dragging the `ball` when it hits the `paddle`
             # from the top.
-            if (i, j+b) in self.coords[:self._size]:
-                # The `ball` will become part of the `paddle` for exactly
-                # one iteration.
-                self.ball.displacement = [0, 0]  # Won't move on its own.
+            if top:
                 Breakout.Paddle.dragging = not Breakout.Paddle.dragging
                 if Breakout.Paddle.dragging:
-                    self.blocks.append(self.ball)
-                    Breakout.entities["paddle"].add(self.ball)
-                else:
-                    self.blocks.pop()
-                    self.coords.pop()
-                    Breakout.entities["paddle"].remove(self.ball)
-            else:
-                # Since we only changed `ball.displacement`,
-                # `ball.velocity` still stores its previous value.
-                self.ball.displacement = [x*DIST_BLOCKS
-                                          for x in self.ball.velocity
-                                          ]
-        
-        def check_paddle_reflect(self):
-            """ Hypothesis for when the ``ball`` reflects from the ``paddle``. """
+                    # The `ball` will become part of the `paddle` for
+                    # exactly one iteration.
+                    self.attach(True)
+                    ball.displacement = (0, 0)  # Won't move on its own.
+                    return
+                self.attach(False)
+
+            # Reflection occurs if the `ball` hits the `paddle` directly
+            # from above or at a vertex.
+            if not Breakout.Paddle.dragging and (top or vertex):
+                # Reverse the vertical coordinate.
+                ball.velocity[1] = -1
+                # Horizontal reflection happens only when the paddle is
+                # hit at a vertex.
+                left, right = self.coords[0], self.coords[-1]
+                if (i, j+b) == left or (i+a, j+b) == left:
+                    # The ball moves left if it hit the left corner of
+                    # the `paddle`.
+                    ball.velocity[0] = -1
+                elif (i, j+b) == right or (i+a, j+b) == right:
+                    # The `ball` moves right if it hit the right corner
+                    # of the `paddle`.
+                    ball.velocity[0] = 1
 
-            if not Breakout.Paddle.dragging:
-                a, b = self.ball.velocity
-                i, j = self.ball.coords
-                # Reflection occurs if the `ball` hits the `paddle` directly
-                # from above or at a vertex.
-                if ((i, j+b) in self.coords[:self._size]
-                        or (i+a, j+b) in self.coords[:self._size]):
-                    # Reverse the vertical coordinate.
-                    self.ball.velocity[1] = -1
-                    # Horizontal reflection happens only when the paddle
-                    # is hit at a vertex.
-                    if ((i, j+b) == self.coords[0]
-                            or (i+a, j+b) == self.coords[0]):
-                        # The ball moves left if it hit the left corner
-                        # of the `paddle`.
-                        self.ball.velocity[0] = -1
-                    elif ((i, j+b) == self.coords[self._size-1]
-                          or (i+a, j+b) == self.coords[self._size-1]):
-                        # The `ball` moves right if it hit the right corner
-                        # of the `paddle`.
-                        self.ball.velocity[0] = 1
-                # Adjust from positional coordinates to the appropriate
-                # number of pixels.
-                self.ball.displacement = [x*DIST_BLOCKS
-                                          for x in self.ball.velocity
-                                          ]
+            # Adjust from positional coordinates to the appropriate
+            # number of pixels.
+            ball.displacement = _DISP[tuple(ball.velocity)]
     
     class Ball(Block):
         """
@@ -458,12 +593,25 @@ class Breakout(Game):
         All other interactions have already been taken care of.
         """
 
-        def __init__(self, i, j):
+        def __init__(self, i, j, group):
+            """
+            Spawn the ball, standing still.
+
+            Parameters
+            ----------
+            i : int
+                Horizontal position on the grid.
+            j : int
+                Vertical position on the grid.
+            group : pygame.sprite.Group
+                The game's container for the ball.
+            """
+
             self.velocity = [0, 0]
             super().__init__(i, j)
 
             # Add `self` (a `Sprite`) to a `Group` for drawing.
-            Breakout.entities["ball"].add(self)
+            group.add(self)
         
         def check_border_reflect(self):
             """ Hypothesis for when the ``ball`` reflects from the border. """
@@ -482,9 +630,7 @@ class Breakout(Game):
             # Adjust from positional coordinates to the appropriate
             # number of pixels.
             if not Breakout.Paddle.dragging:
-                self.displacement = [x*DIST_BLOCKS
-                                     for x in self.velocity
-                                     ]
+                self.displacement = _DISP[tuple(self.velocity)]
 
 
 class Client(BaseClient):
@@ -506,16 +652,23 @@ class Client(BaseClient):
         ----------
         t : int
             A timer.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            The areas of the screen to update (all of it with ``None``).
         """
 
         # Update `Block`'s mechanics.
         self.game.update_entities(t=t)
 
-        # Implement the game mechanics and check for endgame.
-        self.game.manage(t)
+        # Implement the game mechanics and check for endgame. The game
+        # can only change on the `ball`'s action frames.
+        if t % self.game.action_period == 0:
+            self.game.manage(t)
 
         # Draw the game objects to the screen.
-        self.game.draw_entities()
+        return self.game.draw_entities()
 
     def handle_events(self, key, state):
         """
@@ -1,10 +1,9 @@
 """ This module contains a base class with general game mechanics. """
 
-import json
 import pygame
 from pygame.locals import *
 from abc import ABC, abstractmethod
-from ..client import high_scores_dir
+from ..client import load_high_scores, save_high_scores
 from ..screen_generator import Background, VictoryScreen, DefeatScreen
 
 __all__ = ["Game"]
@@ -18,10 +17,13 @@ class Game(ABC):
     ----------
     entities : dict
         Container for all `Block` objects and derivatives.
+    action_period : int
+        Frames between the calls to `manage` (1 for every frame).
     """
 
     # Class variables, shared with instances and nested classes.
     entities = None
+    action_period = 1
     
     def __init__(self):
         """ Set instance variables and load background. """
@@ -32,7 +34,11 @@ class Game(ABC):
         self.paused = False
         self.running = True
         """ Whether this game is active. """
+        self._dirty = True
+        """ Whether the screen changed since it was last drawn. """
         self.name = self.__class__.__name__
+        # The high scores, read only when the file has changed.
+        self._high_scores = load_high_scores()
         # Access the current surface.
         self.screen = pygame.display.get_surface()
 
@@ -62,6 +68,9 @@ class Game(ABC):
             ``KEYDOWN`` or ``KEYUP``.
         """
         
+        # Input may change the screen, even while paused.
+        self._dirty = True
+
         # Setting *P* for pause/unpause and *Return* for reset
         if state == KEYDOWN:
             if key == K_p:
@@ -92,29 +101,27 @@ class Game(ABC):
     def update_score(self, *args):
         """ Communicate with the `high-scores.json` file. """
 
-        # Read the highest score for the current game.
-        try:
-            with open(high_scores_dir, "r") as file:
-                high_scores = json.load(file)
-                self.highest_score = high_scores[self.name]
-        except Exception as e:
-            print(e)
-            print("Failed to read 'high-scores.json'.")
-            pass  # This interrupts the scoring system without stopping the game.
+        # Read the highest score for the current game (the file was
+        # read when the game started, and reported if it failed).
+        high_scores = self._high_scores
+        if self.name not in high_scores:
+            return  # This interrupts the scoring system without stopping the game.
+        self.highest_score = high_scores[self.name]
         
-        # Update the highest score to the .json file.
+        # Update the highest score to the .json file, only when it
+        # changes.
         if self.score > self.highest_score:
             if self.score >= 1e8:
                 self.score = int(1e8 - 1)  # Max value
             else:
                 self.highest_score = self.score
-            try:
-                with open(high_scores_dir, "w") as file:
-                    high_scores[self.name] = self.highest_score
-                    json.dump(high_scores, file)
-            except Exception as e:
-                print(e)
-                # print("Failed to update 'high-scores.json'.")
+            if high_scores[self.name] != self.highest_score:
+                high_scores[self.name] = self.highest_score
+                try:
+                    save_high_scores(high_scores)
+                except Exception as e:
+                    print(e)
+                    # print("Failed to update 'high-scores.json'.")
     
     @abstractmethod
     def check_victory(self):
@@ -133,6 +140,7 @@ class Game(ABC):
             entity.empty()
         # Show the victory message.
         VictoryScreen()
+        self._dirty = True
     
     def toggle_defeat(self):
         """ Removes all elements from the screen and show defeat_screen. """
@@ -143,17 +151,36 @@ class Game(ABC):
             entity.empty()
         # Show the defeat message.
         DefeatScreen()
+        self._dirty = True
     
+    def redraw(self):
+        """ Draw the whole game again on the next frame. """
+
+        self._dirty = True
+
     def update_entities(self, **kwargs):
         """ Update `Block`'s mechanics. """
 
         if not self.paused:
             for entity in self.entities.values():
                 entity.update(speed=self.speed, **kwargs)
+            # Moving sprites may have changed the screen.
+            self._dirty = self._dirty or self.running
     
     def draw_entities(self):
-        """ Draw all the sprites to the screen. """
+        """
+        Draw all the sprites to the screen, if anything changed.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            ``None`` to update the whole screen, or an empty list when
+            nothing changed since the last call.
+        """
 
+        if not self._dirty:
+            return []
+        self._dirty = False
         if self.running:
             # Draw the background (clear previous drawings).
             Background()
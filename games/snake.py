@@ -2,16 +2,43 @@
 
 import random
 import pygame
+from collections import deque
 from pygame.locals import *
 from ..constants import *
 from ..client import BaseClient
 from ..block import Block, BlinkingBlock
+from ..screen_generator import Background
 from . import game_manuals
 from .game_engine import Game
 
 __doc__ = "".join([__doc__, "\n\nCheck `", game_manuals, "` for instructions."])
 __all__ = ["Snake"]
 
+_ALL_CELLS = frozenset((i, j) for i in range(10) for j in range(20))
+""" Every cell of the grid. """
+
+
+class _DirtyBlock(Block, pygame.sprite.DirtySprite):
+    """
+    A :class:`Block` that sets its ``dirty`` flag whenever it's placed,
+    so `Snake.render` only redraws what changed.
+    """
+
+    def set_position(self, i, j):
+        """
+        Move to the specified position and flag the change.
+
+        Parameters
+        ----------
+        i : int
+            Horizontal position on the grid.
+        j : int
+            Vertical position on the grid.
+        """
+
+        super().set_position(i, j)
+        self.dirty = 1
+
 
 class Snake(Game):
     """
@@ -21,36 +48,49 @@ class Snake(Game):
     ----------
     direction : str
         Where the snake should turn to.
+    dx, dy : int
+        The steps of the head along each axis towards ``direction``.
     growing : bool
         Whether the snake should grow one block after eating.
     entities : dict
         Containers for the objects to be drawn (name:group).
+    render : pygame.sprite.LayeredDirty
+        Every sprite in ``entities``, drawn only where they changed.
     """
 
     direction = "down"
+    dx, dy = CONVERT[direction]
     start_speed = 10
     speeds = (start_speed, 2*start_speed)
     growing = False
     entities = {"body": pygame.sprite.RenderPlain(),
                 "food": pygame.sprite.RenderPlain(),
                 }
+    render = pygame.sprite.LayeredDirty()
     
     def __init__(self):
         """ Initialize instance attributes and instantiate game objects. """
 
         super().__init__()
         self.speed = Snake.start_speed
+        self.action_period = int(FPS/self.speed)  # Frames between moves.
         self.key_enabled = False
+        # Areas left by moved or removed sprites are covered with the
+        # `Background`.
+        Snake.render.clear(self.screen, Background.get_image())
+        self._screen_rect = self.screen.get_rect()
         
         # Spawn the entities.
         self.snake = self.Body()
-        self.food = self.Food()
+        self.food = self.Food(self.snake.coords_set)
 
     def reset(self):
         """ Remove all elements from the screen and start again. """
 
         Snake.direction = "down"
+        Snake.dx, Snake.dy = CONVERT["down"]
         Snake.growing = False
+        Snake.render.empty()
         super().reset()
     
     def handle_events(self, key, state):
@@ -71,27 +111,36 @@ class Snake(Game):
             if state == KEYDOWN:  # Key pressed.
                 if key == K_SPACE:
                     self.speed = Snake.speeds[1]
+                    self.action_period = int(FPS/self.speed)
                 # Lock direction changes after the first until the next iteration.
                 elif self.key_enabled:
                     self.key_enabled = False
                     # Direction changes, making sure the snake's head won't enter itself.
                     if key == K_UP and self.direction != "down":
                         Snake.direction = "up"
+                        Snake.dx, Snake.dy = CONVERT["up"]
                     elif key == K_DOWN and self.direction != "up":
                         Snake.direction = "down"
+                        Snake.dx, Snake.dy = CONVERT["down"]
                     elif key == K_LEFT and self.direction != "right":
                         Snake.direction = "left"
+                        Snake.dx, Snake.dy = CONVERT["left"]
                     elif key == K_RIGHT and self.direction != "left":
                         Snake.direction = "right"
+                        Snake.dx, Snake.dy = CONVERT["right"]
 
             if state == KEYUP:  # Key released.
                 if key == K_SPACE:
                     self.speed = Snake.speeds[0]
+                    self.action_period = int(FPS/self.speed)
     
     def manage(self, t):
         """
         Game logic implementation.
 
+        Runs at the action rate of `speed` blocks per second: the
+        clients only call it every ``action_period`` frames.
+
         Parameters
         ----------
         t : int
@@ -99,12 +148,13 @@ class Snake(Game):
         """
 
         if self.running and not self.paused:
-            self.check_eat()
-            # Set the action rate at `speed` blocks per second.
-            if t % int(FPS/self.speed) == 0:
+            # The score only changes when the snake grows.
+            if Snake.growing:
                 self.update_score()
-                self.snake.move()
-                self.key_enabled = True
+            self.snake.move()
+            self.key_enabled = True
+            # The head only reaches the food by moving.
+            self.check_eat()
         
         super().manage()  # Manage endgame.
     
@@ -113,11 +163,46 @@ class Snake(Game):
 
         if self.snake.head.coords == self.food.coords:
             Snake.growing = True
-            self.food.respawn()
             # Avoid the food spawning inside the snake.
-            while self.food.coords in self.snake.coords:
-                self.food.respawn()
+            self.food.respawn(self.snake.coords_set)
     
+    def update_entities(self, **kwargs):
+        """
+        Update `Block`'s mechanics.
+
+        The body's `Block`s stand still between moves, so only the
+        food is updated (blinking). The sprites flag their own
+        changes for `draw_entities`, so this doesn't call for a full
+        redraw.
+        """
+
+        if not self.paused:
+            Snake.entities["food"].update(speed=self.speed, **kwargs)
+
+    def draw_entities(self):
+        """
+        Draw the sprites that changed to the screen.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            The areas of the screen to update (all of it with ``None``).
+        """
+
+        if not self.running:
+            return super().draw_entities()
+        if self._dirty:
+            # Paint every sprite again over the `Background`.
+            self._dirty = False
+            Snake.render.repaint_rect(self._screen_rect)
+            Snake.render.draw(self.screen)
+            return None
+        # Only the head moves and only the food blinks or respawns, so
+        # when neither is flagged there's nothing to draw.
+        if self.snake.head.dirty or self.food.dirty:
+            return Snake.render.draw(self.screen)
+        return []
+
     def update_score(self):
         """ Scoring mechanics. """
 
@@ -158,21 +243,39 @@ class Snake(Game):
         i, j = self.snake.head.coords
         if ((0 <= i < 10) and
                 (0 <= j < 20) and
-                (i, j) not in self.snake.coords[1:]):
+                not self.snake.bitten):
             return False
         else:
             return True
     
     class Body:
-        """ Organizes the snake's drawing, movement, and growth. """
+        """
+        Organizes the snake's drawing, movement, and growth.
+
+        Attributes
+        ----------
+        segments : collections.deque
+            The snake's `Block`s, from head to tail.
+        coords_set : set[tuple[int, int]]
+            The cells taken by the snake.
+        bitten : bool
+            Whether the head moved into a cell of the body.
+        """
+
+        __slots__ = ("segments", "coords_set", "bitten", "head", "tail")
         
         def __init__(self):
             # Set the snake's initial position.
-            self.segments = [Block(4, 5), Block(4, 4), Block(4, 3)]
-            self.coords = [segment.coords for segment in self.segments]
+            self.segments = deque([_DirtyBlock(4, 5),
+                                   _DirtyBlock(4, 4),
+                                   _DirtyBlock(4, 3),
+                                   ])
+            self.coords_set = {segment.coords for segment in self.segments}
+            self.bitten = False
 
             # Add its `Block`s to the container for drawing.
             Snake.entities["body"].add(*self.segments)
+            Snake.render.add(*self.segments)
 
             # Identify the head and the tail.
             self.head = self.segments[0]
@@ -181,45 +284,82 @@ class Snake(Game):
         def move(self):
             """ Handle the snake's movement and growth mechanics. """
             
-            # Movement is achieved by creating a new `Block` sprite in
-            # the head's next position, ...
-            i, j = CONVERT[Snake.direction]
+            # Movement is achieved by placing a `Block` sprite in the
+            # head's next position, ...
+            i, j = Snake.dx, Snake.dy
             a, b = self.head.coords
-            self.head = Block(i+a, j+b)
-            self.segments.insert(0, self.head)
-            Snake.entities["body"].add(self.head)
             # ... keeping the tail in the same place if the head doesn't
-            # hit the food, ...
+            # hit the food, with a new `Block`, ...
             if Snake.growing:
                 Snake.growing = False
+                self.head = _DirtyBlock(i+a, j+b)
+                Snake.entities["body"].add(self.head)
+                Snake.render.add(self.head)
             else:
-                # ... or deleting it (references and drawing) otherwise.
+                # ... or taking the tail's `Block` otherwise, which saves
+                # creating a sprite and killing another on every move.
                 self.segments.pop()
-                self.tail.kill()
+                self.coords_set.discard(self.tail.coords)
+                self.tail.set_position(i+a, j+b)
+                self.head = self.tail
                 self.tail = self.segments[-1]
+            self.segments.appendleft(self.head)
 
-            # Update the list of coordinates.
-            self.coords = [segment.coords
-                           for segment in self.segments]
+            # Update the set of coordinates. The head bites the body if
+            # its new cell is already taken.
+            self.bitten = self.head.coords in self.coords_set
+            self.coords_set.add(self.head.coords)
     
-    class Food(BlinkingBlock):
+    class Food(BlinkingBlock, _DirtyBlock):
         """ Organizes the food's spawn randomly. """
         
-        def __init__(self):
-            """ Generate random coordinates to spawn a `BlinkingBlock` at. """
+        def __init__(self, taken=()):
+            """
+            Spawn a `BlinkingBlock` at a random free cell.
+
+            Parameters
+            ----------
+            taken : set[tuple[int, int]], optional
+                Cells the food can't spawn at. Defaults to none.
+            """
 
-            i = random.randint(0, 9)
-            j = random.randint(0, 19)
+            i, j = random.choice(tuple(_ALL_CELLS.difference(taken)))
             super().__init__(i, j)
             # Add the instance to the container for drawing.
             Snake.entities["food"].add(self)
+            Snake.render.add(self)
         
-        def respawn(self):
-            """ Generate new random coordinates to move the `BlinkingBlock` to. """
+        def respawn(self, taken=()):
+            """
+            Move the `BlinkingBlock` to a random free cell.
+
+            Sampling from the free cells directly takes the same time
+            however long the snake grows.
+
+            Parameters
+            ----------
+            taken : set[tuple[int, int]], optional
+                Cells the food can't spawn at. Defaults to none.
+            """
+
+            free = _ALL_CELLS.difference(taken)
+            if free:  # The grid may be full right before victory.
+                self.set_position(*random.choice(tuple(free)))
 
-            i = random.randint(0, 9)
-            j = random.randint(0, 19)
-            self.set_position(i, j)
+        def update(self, t=0, **kwargs):
+            """
+            Blink, flagging the change for `Snake.render`.
+
+            Parameters
+            ----------
+            t : int, optional
+                A timer. Defaults to 0.
+            """
+
+            image = self.image
+            super().update(t=t, **kwargs)
+            if self.image is not image:
+                self.dirty = 1
 
 
 class Client(BaseClient):
@@ -241,16 +381,23 @@ class Client(BaseClient):
         ----------
         t : int
             A timer.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            The areas of the screen to update (all of it with ``None``).
         """
 
         # Update `Block`'s mechanics.
         self.game.update_entities(t=t)
 
-        # Implement the game mechanics and check for endgame.
-        self.game.manage(t)
+        # Implement the game mechanics and check for endgame. The game
+        # can only change on the snake's action frames.
+        if t % self.game.action_period == 0:
+            self.game.manage(t)
 
         # Draw the game objects to the screen.
-        self.game.draw_entities()
+        return self.game.draw_entities()
 
     def handle_events(self, key, state):
         """
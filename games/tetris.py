@@ -6,12 +6,146 @@ from pygame.locals import *
 from ..constants import *
 from ..client import BaseClient
 from ..block import Block
+from ..screen_generator import Background
 from . import game_manuals
 from .game_engine import Game
 
 __doc__ = "".join([__doc__, "\n\nCheck `", game_manuals, "` for instructions."])
 __all__ = ["Tetris"]
 
+_ROTATIONS = {
+    "T": {
+        1: (2, ((-1, 0), (0, 0), (1, 0), (0, -1))),
+        2: (3, ((-1, 0), (0, 0), (0, -1), (0, 1))),
+        3: (4, ((-1, 0), (0, 0), (1, 0), (0, 1))),
+        4: (1, ((0, -1), (0, 0), (1, 0), (0, 1))),
+    },
+    "J": {
+        1: (2, ((-1, -1), (-1, 0), (0, 0), (1, 0))),
+        2: (3, ((0, -1), (0, 0), (0, 1), (-1, 1))),
+        3: (4, ((-1, -1), (0, -1), (1, -1), (1, 0))),
+        4: (1, ((-1, -1), (0, -1), (-1, 0), (-1, 1))),
+    },
+    "L": {
+        1: (2, ((-1, 0), (0, 0), (1, 0), (1, -1))),
+        2: (3, ((-1, -1), (0, -1), (0, 0), (0, 1))),
+        3: (4, ((-1, 0), (-1, -1), (0, -1), (1, -1))),
+        4: (1, ((-1, -1), (-1, 0), (-1, 1), (0, 1))),
+    },
+    "S": {
+        1: (2, ((-1, 0), (0, 0), (0, -1), (1, -1))),
+        2: (1, ((0, 1), (0, 0), (-1, 0), (-1, -1))),
+    },
+    "Z": {
+        1: (2, ((-1, -1), (0, -1), (0, 0), (1, 0))),
+        2: (1, ((0, -1), (0, 0), (-1, 0), (-1, 1))),
+    },
+    "I": {
+        1: (2, ((-1, 0), (0, 0), (1, 0), (2, 0))),
+        2: (1, ((0, -1), (0, 0), (0, 1), (0, 2))),
+    },
+    "O": {
+        1: (1, ((0, 0), (0, 1), (1, 0), (1, 1))),
+    },
+}
+""" Rotations of each shape (id:(next id, offsets of the `Block`s)). """
+_SHAPES = tuple(_ROTATIONS)
+""" Characters representing each shape. """
+_SPEED_RAMP = tuple(10**(0.05*k) for k in range(22))
+""" Scales of the fall speed, one step every 30 seconds until over 10. """
+_LINE_BONUS = (0, 2, 6, 12, 20)
+""" Base points for clearing 0 to 4 lines at once, before scaling. """
+_ROTATION_BOUNDS = {
+    shape: {rotation_id: (min(a for a, _ in offsets),
+                          max(a for a, _ in offsets),
+                          max(b for _, b in offsets))
+            for rotation_id, (_, offsets) in rotations.items()}
+    for shape, rotations in _ROTATIONS.items()
+}
+""" Horizontal limits and lowest offset of each rotation in `_ROTATIONS`. """
+_COLUMN_MASK = sum(1 << 10*k for k in range(22))
+""" Bit flags of a whole column in the first column of a bitmask. """
+_PREVIEWS = {
+    "T": ("=============\n"
+          "Next:\n"
+          "    _\n"
+          " _ |_| _\n"
+          "|_||_||_|"),
+    "J": ("=============\n"
+          "Next:\n"
+          " _\n"
+          "|_| _  _\n"
+          "|_||_||_|"),
+    "L": ("=============\n"
+          "Next:\n"
+          "       _\n"
+          " _  _ |_|\n"
+          "|_||_||_|"),
+    "S": ("=============\n"
+          "Next:\n"
+          "    _  _\n"
+          " _ |_||_|\n"
+          "|_||_|"),
+    "Z": ("=============\n"
+          "Next:\n"
+          " _  _\n"
+          "|_||_| _\n"
+          "   |_||_|"),
+    "I": ("=============\n"
+          "Next:\n"
+          " _  _  _  _\n"
+          "|_||_||_||_|"),
+    "O": ("=============\n"
+          "Next:\n"
+          " _  _\n"
+          "|_||_|\n"
+          "|_||_|"),
+}
+""" Drawings of each shape, printed as the next `Piece`'s preview. """
+
+
+def _cell_bit(i, j):
+    """
+    Bit flag of a grid cell in a `Tetris.FallenBlocks.grid` bitmask.
+
+    The two rows above the grid are included, since `Piece`s spawn
+    partially outside of it.
+
+    Parameters
+    ----------
+    i : int
+        Horizontal position on the grid.
+    j : int
+        Vertical position on the grid.
+
+    Returns
+    -------
+    int
+        ``1 << ((j+2)*10 + i)``, or 0 for cells outside the bitmask.
+    """
+
+    if 0 <= i < 10 and -2 <= j < 20:
+        return 1 << ((j+2)*10 + i)
+    return 0
+
+
+def _row_mask(j):
+    """
+    Bit flags of a whole row in a `Tetris.FallenBlocks.grid` bitmask.
+
+    Parameters
+    ----------
+    j : int
+        Vertical position on the grid.
+
+    Returns
+    -------
+    int
+        The ten bits of the row (see `_cell_bit`).
+    """
+
+    return 0b1111111111 << ((j+2)*10)
+
 
 class Tetris(Game):
     """ Implements `Game` with a Tetris game.
@@ -35,6 +169,10 @@ class Tetris(Game):
         super().__init__()
         self.__start = 1
         self.speed = Tetris.start_speed  # Fall speed (in `Block`s per second).
+        self._ramp_step = 0  # Index of the current scale in `_SPEED_RAMP`.
+        # Frames between falls and between horizontal moves.
+        self._fall_period = int(FPS/self.speed)
+        self._move_period = int(FPS/(7 + 3*self.speed))
 
         # Spawn the entities.
         self.piece = self.Piece()  # Tetrominoes
@@ -81,11 +219,7 @@ class Tetris(Game):
                         self.piece.switch()  # Only once for every new `piece`.
 
             if state == KEYUP:  # Key released.
-                if key == K_DOWN:
-                    self.Piece.direction = ""
-                elif key == K_LEFT:
-                    self.Piece.direction = ""
-                elif key == K_RIGHT:
+                if key in (K_DOWN, K_LEFT, K_RIGHT):
                     self.Piece.direction = ""
     
     def manage(self, t):
@@ -101,34 +235,53 @@ class Tetris(Game):
         if self.running and not self.paused:
             self._detect_game_on()
             # Set the action rate at `speed` `Block`s per second.
-            if t % int(FPS/self.speed) == 0:
+            if t % self._fall_period == 0:
                 self.piece.move("down")  # Slow fall
                 self.try_spawn_next()
 
             # `speed` scales over time, every 30 seconds.
-            if self.speed <= 10:
+            if self.speed <= 10 and self._ramp_step < len(_SPEED_RAMP)-1:
                 if t % (30*FPS) == 0:
-                    self.speed *= 10**0.05
+                    self._ramp_step += 1
+                    self.speed = Tetris.start_speed*_SPEED_RAMP[self._ramp_step]
+                    self._fall_period = int(FPS/self.speed)
+                    self._move_period = int(FPS/(7 + 3*self.speed))
             
             # Adjust for movement proportional to the scaling `speed`.
-            if t % int(FPS/(7 + 3*self.speed)) == 0:
+            if t % self._move_period == 0:
                 # Horizontal movement and downwards acceleration.
                 self.piece.move(self.piece.direction)
 
         super().manage()  # Manage endgame.
     
+    def draw_entities(self):
+        """
+        Place the `piece`'s `Block`s, then draw as `Game.draw_entities`.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            ``None`` to update the whole screen, or an empty list when
+            nothing changed since the last call.
+        """
+
+        self.piece.sync()
+        if not (self._dirty and self.running):
+            return super().draw_entities()
+        self._dirty = False
+        # The `Background` and the `fallen` structure come in a single
+        # image, then the current `piece` is drawn over.
+        self.fallen.draw(self.screen)
+        Tetris.entities["piece"].draw(self.screen)
+        return None
+
     def update_score(self, full_lines_number):
         """ Scoring mechanics. """
         
         # More points for more lines at once.
-        if full_lines_number == 1:
-            self.score += int(2 + self.speed*self.fallen.height)*15
-        elif full_lines_number == 2:
-            self.score += int(6 + self.speed*self.fallen.height)*15
-        elif full_lines_number == 3:
-            self.score += int(12 + self.speed*self.fallen.height)*15
-        elif full_lines_number == 4:
-            self.score += int(20 + self.speed*self.fallen.height)*15
+        if full_lines_number:
+            bonus = _LINE_BONUS[full_lines_number]
+            self.score += int(bonus + self.speed*self.fallen.height)*15
         super().update_score()
     
     def try_spawn_next(self):
@@ -140,6 +293,7 @@ class Tetris(Game):
     def spawn_next(self):
 
         # Transfer the `piece`'s `Block`s to the `fallen` structure.
+        self.piece.sync()
         self.fallen.grow()
         # Account for a proper score according to the lines cleared.
         full_lines_number = self.fallen.remove_full_lines()
@@ -197,7 +351,9 @@ class Tetris(Game):
             self.blocks = {}
             self.next_id = None
             self.coords = None
+            self.offsets = None
             self.piece = None
+            self.moved = False  # Whether the `Block`s lag behind.
 
             # If there is any `Tetris.Piece.stored_shape`, store
             # its value into `self.active_shape`.
@@ -206,13 +362,9 @@ class Tetris(Game):
             else:
                 # Otherwise, choose the value of `active_shape`
                 # randomly.
-                self.active_shape = random.choice(
-                    ("T", "J", "L", "S", "Z", "I", "O")
-                )
+                self.active_shape = random.choice(_SHAPES)
             # Store a new shape.
-            Tetris.Piece.stored_shape = random.choice(
-                ("T", "J", "L", "S", "Z", "I", "O")
-            )
+            Tetris.Piece.stored_shape = random.choice(_SHAPES)
             # Spawn a `Piece` object with the `active_shape`.
             self.spawn()
             # Permit one switch between `active_shape` and
@@ -224,75 +376,16 @@ class Tetris(Game):
 
             self.place(self.active_shape, 4, 0)
             # Identify the next rotated position.
-            self.next_id, self.piece = self.blocks[1]
+            self.next_id, self.offsets = self.blocks[1]
+            i, j = self.coords
+            self.piece = tuple(Block(i+a, j+b) for a, b in self.offsets)
             Tetris.entities["piece"].empty()
             Tetris.entities["piece"].add(*self.piece)
         
         def print_preview(self):
             """ Showcase `stored_shape`. """
 
-            if Tetris.Piece.stored_shape == "T":
-                drawing = "".join([
-                    "=============\n"
-                    "Next:\n",
-                    "    _\n",
-                    " _ |_| _\n",
-                    "|_||_||_|"
-                ])
-                print(drawing)
-            elif Tetris.Piece.stored_shape == "J":
-                drawing = "".join([
-                    "=============\n"
-                    "Next:\n",
-                    " _\n",
-                    "|_| _  _\n",
-                    "|_||_||_|"
-                ])
-                print(drawing)
-            elif Tetris.Piece.stored_shape == "L":
-                drawing = "".join([
-                    "=============\n"
-                    "Next:\n",
-                    "       _\n",
-                    " _  _ |_|\n",
-                    "|_||_||_|"
-                ])
-                print(drawing)
-            elif Tetris.Piece.stored_shape == "S":
-                drawing = "".join([
-                    "=============\n"
-                    "Next:\n",
-                    "    _  _\n",
-                    " _ |_||_|\n",
-                    "|_||_|"
-                ])
-                print(drawing)
-            elif Tetris.Piece.stored_shape == "Z":
-                drawing = "".join([
-                    "=============\n"
-                    "Next:\n",
-                    " _  _\n",
-                    "|_||_| _\n",
-                    "   |_||_|"
-                ])
-                print(drawing)
-            elif Tetris.Piece.stored_shape == "I":
-                drawing = "".join([
-                    "=============\n"
-                    "Next:\n",
-                    " _  _  _  _\n",
-                    "|_||_||_||_|"
-                ])
-                print(drawing)
-            elif Tetris.Piece.stored_shape == "O":
-                drawing = "".join([
-                    "=============\n"
-                    "Next:\n",
-                    " _  _\n",
-                    "|_||_|\n",
-                    "|_||_|"
-                ])
-                print(drawing)
+            print(_PREVIEWS[Tetris.Piece.stored_shape])
         
         def switch(self):
             """
@@ -317,7 +410,7 @@ class Tetris(Game):
         
         def place(self, shape, i, j):
             """
-            Positioning of `Block`s to form each shape and track rotation.
+            Track the position of a shape's reference and its rotations.
 
             Parameters
             ----------
@@ -330,46 +423,8 @@ class Tetris(Game):
             """
 
             self.coords = (i, j)
-            if shape == "T":
-                self.blocks = {
-                    1: (2, (Block(i-1, j), Block(i, j), Block(i+1, j), Block(i, j-1))),
-                    2: (3, (Block(i-1, j), Block(i, j), Block(i, j-1), Block(i, j+1))),
-                    3: (4, (Block(i-1, j), Block(i, j), Block(i+1, j), Block(i, j+1))),
-                    4: (1, (Block(i, j-1), Block(i, j), Block(i+1, j), Block(i, j+1)))
-                }
-            elif shape == "J":
-                self.blocks = {
-                    1: (2, (Block(i-1, j-1), Block(i-1, j), Block(i, j), Block(i+1, j))),
-                    2: (3, (Block(i, j-1), Block(i, j), Block(i, j+1), Block(i-1, j+1))),
-                    3: (4, (Block(i-1, j-1), Block(i, j-1), Block(i+1, j-1), Block(i+1, j))),
-                    4: (1, (Block(i-1, j-1), Block(i, j-1), Block(i-1, j), Block(i-1, j+1)))
-                }
-            elif shape == "L":
-                self.blocks = {
-                    1: (2, (Block(i-1, j), Block(i, j), Block(i+1, j), Block(i+1, j-1))),
-                    2: (3, (Block(i-1, j-1), Block(i, j-1), Block(i, j), Block(i, j+1))),
-                    3: (4, (Block(i-1, j), Block(i-1, j-1), Block(i, j-1), Block(i+1, j-1))),
-                    4: (1, (Block(i-1, j-1), Block(i-1, j), Block(i-1, j+1), Block(i, j+1)))
-                }
-            elif shape == "S":
-                self.blocks = {
-                    1: (2, (Block(i-1, j), Block(i, j), Block(i, j-1), Block(i+1, j-1))),
-                    2: (1, (Block(i, j+1), Block(i, j), Block(i-1, j), Block(i-1, j-1)))
-                }
-            elif shape == "Z":
-                self.blocks = {
-                    1: (2, (Block(i-1, j-1), Block(i, j-1), Block(i, j), Block(i+1, j))),
-                    2: (1, (Block(i, j-1), Block(i, j), Block(i-1, j), Block(i-1, j+1)))
-                }
-            elif shape == "I":
-                self.blocks = {
-                    1: (2, (Block(i-1, j), Block(i, j), Block(i+1, j), Block(i+2, j))),
-                    2: (1, (Block(i, j-1), Block(i, j), Block(i, j+1), Block(i, j+2)))
-                }
-            elif shape == "O":
-                self.blocks = {
-                    1: (1, (Block(i, j), Block(i, j+1), Block(i+1, j), Block(i+1, j+1)))
-                }
+            # The offsets are static, so no `Block`s are created here.
+            self.blocks = _ROTATIONS[shape]
         
         def calculate_dimensions(self):
             """
@@ -381,46 +436,41 @@ class Tetris(Game):
                 Horizontal and vertical limits.
             """
 
-            try:
-                i_min = min(
-                    [block.coords[0] for block in Tetris.entities["piece"]]
-                )
-                i_max = max(
-                    [block.coords[0] for block in Tetris.entities["piece"]]
-                )
-                j_max = max(
-                    [block.coords[1] for block in Tetris.entities["piece"]]
-                )
-                
-                # Calculation of `height`:
-                heights = []
-                for i in range(i_min, i_max+1):
-                    # For each horizontal coordinate, ...
-                    piece_col = [block.coords[1]
-                                 for block in self.piece
-                                 if block.coords[0] == i]
-                    # choose the `piece`'s lowest vertical coordinate...
-                    j = max([0] + piece_col)
-                    # and the fallen structure's highest vertical coordinate.
-                    fall_col = [block.coords[1]
-                                for block in Tetris.entities["fallen"]
-                                if block.coords[0] == i
-                                and block.coords[1] > j]
-                    # If there's anything below the `piece` in this column, ...
-                    if fall_col:
-                        # add the distance to the list of heights.
-                        heights.append(min(fall_col)-j-1)
-                    else:
-                        # Otherwise, add the distance to the bottom of
-                        # the grid to the list.
-                        heights.append(19-j)
-                # The `height` attribute is the shortest distance from
-                # a `piece` to the fallen structure.
-                self.height = min(heights)
-                return i_min, i_max, j_max
-            # In case any calculation fails, return dummy values.
-            except ValueError:
-                return 10, 10, 20
+            # The `piece`'s cells follow from its reference coordinates
+            # and current rotation, without reading the `Block`s.
+            i0, j0 = self.coords
+            coords = [(i0+a, j0+b) for a, b in self.offsets]
+            i_min = min(coords)[0]
+            i_max = max(coords)[0]
+            j_max = max(j for _, j in coords)
+            
+            # Calculation of `height`:
+            # For each horizontal coordinate, choose the `piece`'s
+            # lowest vertical coordinate...
+            bottoms = {}
+            for i, j in coords:
+                bottoms[i] = max(bottoms.get(i, 0), j)
+            grid = Tetris.FallenBlocks.grid
+            heights = []
+            for i in range(i_min, i_max+1):
+                j = bottoms.get(i, 0)
+                # and the fallen structure's cells below it, as the
+                # bitmask's column shifted to start at row ``j+1``
+                # (see `_cell_bit`).
+                below = grid >> ((j+3)*10 + i) & _COLUMN_MASK
+                # If there's anything below the `piece` in this column, ...
+                if below:
+                    # add the distance (from the lowest bit set) to the
+                    # list of heights.
+                    heights.append(((below & -below).bit_length()-1) // 10)
+                else:
+                    # Otherwise, add the distance to the bottom of the
+                    # grid to the list.
+                    heights.append(19-j)
+            # The `height` attribute is the shortest distance from a
+            # `piece` to the fallen structure.
+            self.height = min(heights)
+            return i_min, i_max, j_max
         
         def move(self, direction):
             """
@@ -436,57 +486,46 @@ class Tetris(Game):
             a, b = CONVERT[direction]
             i, j = self.coords
             i_min, i_max, j_max = self.calculate_dimensions()
+            # Without a direction, only `height` is updated.
+            if not (a or b):
+                return
             
-            # First, build a set with the desired new positions for
-            # each `Block` in the `piece`.
-            X = set(
-                [(block.coords[0]+a, block.coords[1]+b)
-                 for block in self.piece]
-            )
-            # Second, build a set with the current positions of the
+            # Build a bitmask with the desired new positions for each
+            # `Block` in the `piece`, from the current rotation's
+            # offsets.
+            X = 0
+            for x, y in self.offsets:
+                X |= _cell_bit(i+a+x, j+b+y)
+            # Movement can only happen if it doesn't overlap the
             # already formed structure.
-            Y = set(
-                [block.coords
-                 for block in Tetris.entities["fallen"]]
-            )
-            # Movement can only happen if these sets don't intersect.
-            if X & Y == set():
+            if not X & Tetris.FallenBlocks.grid:
                 # Check also if the movement won't get any `Block`
                 # outside screen boundaries.
                 if 0 <= i_min+a and i_max+a < 10 and j_max+b < 20:
-                    # Update the `self.blocks` dict.
-                    self.place(self.active_shape, i+a, j+b)
-                    # Make the movement.
-                    for block in Tetris.entities["piece"]:
-                        i, j = block.coords
-                        block.set_position(i+a, j+b)
+                    # Make the movement (the `Block`s follow in `sync`).
+                    self.coords = (i+a, j+b)
+                    self.moved = True
         
         def rotate(self):
-            # First set: desired new positions of the `piece`'s
+            # The rotated `piece` must remain inside the grid, which
+            # the limits of its next rotated state tell directly.
+            i, j = self.coords
+            a_min, a_max, b_max = _ROTATION_BOUNDS[self.active_shape][self.next_id]
+            if not (0 <= i+a_min and i+a_max < 10 and j+b_max < 20):
+                return
+            # Bitmask of the desired new positions of the `piece`'s
             # `Block`s if rotation were to happen.
-            X = set([block.coords
-                     for block in self.blocks[self.next_id][1]])
-            # Second set: current positions of `Block`s in the
-            # fallen structure.
-            Y = set([block.coords
-                     for block in Tetris.entities["fallen"]])
-            # Third set: positions outside the borders in the
-            # rotation.
-            Z = set([(i, j)
-                     for (i, j) in X
-                     if not (0 <= i < 10 and j < 20)])
+            next_id, offsets = self.blocks[self.next_id]
+            X = 0
+            for a, b in offsets:
+                X |= _cell_bit(i+a, j+b)
             # If the rotated `piece` doesn't collide with the
-            # structure and remains inside the grid, then movement
-            # occurs.
-            if X & Y == set() and Z == set():
-                # Erase the current `piece` from the screen.
-                Tetris.entities["piece"].empty()
-                # Replace it with another with the next rotated state.
-                self.place(self.active_shape, *self.coords)
-                # Update the rotating id and draw the `piece`'s
-                # `Block`s.
-                self.next_id, self.piece = self.blocks[self.next_id]
-                Tetris.entities["piece"].add(*self.piece)
+            # structure, then movement occurs.
+            if not X & Tetris.FallenBlocks.grid:
+                # Take the next rotated state and update the rotating
+                # id (the `Block`s follow in `sync`).
+                self.next_id, self.offsets = next_id, offsets
+                self.moved = True
         
         def fall_inst(self):
             """ Instant fall, moving down a piece by its full ``height``. """
@@ -494,18 +533,60 @@ class Tetris(Game):
             i, j = self.coords
             # Get current `height`.
             self.calculate_dimensions()
-            # Update `blocks`.
-            self.place(self.active_shape, i, j+self.height)
-            # Move down by `self.height`.
-            for block in Tetris.entities["piece"]:
-                a, b = block.coords
-                block.set_position(a, b+self.height)
+            # Move down by `self.height` (the `Block`s follow in `sync`).
+            self.coords = (i, j+self.height)
+            self.moved = True
+
+        def sync(self):
+            """
+            Place the `piece`'s `Block`s at its current cells.
+
+            The movement methods only update ``coords`` and
+            ``offsets``, so the `Block`s are placed once however many
+            times the `piece` moved since the last call.
+            """
+
+            if self.moved:
+                self.moved = False
+                i, j = self.coords
+                for block, (a, b) in zip(self.piece, self.offsets):
+                    block.set_position(i+a, j+b)
     
     class FallenBlocks:
-        """ The structure formed by the fallen piece's `Block`s. """
+        """
+        The structure formed by the fallen piece's `Block`s.
+
+        Attributes
+        ----------
+        grid : int
+            Bitmask of the cells holding a `Block` (see `_cell_bit`).
+        """
+
+        grid = 0
 
         def __init__(self):
             self.height = 0  # Not the same as `piece.height`.
+            self.image = None  # Drawn only when the structure changes.
+            Tetris.FallenBlocks.grid = 0
+
+        def draw(self, surface):
+            """
+            Draw the `Background` and the structure's `Block`s.
+
+            Both are drawn once into ``image``, then copied from it
+            until the structure changes, so each frame takes a single
+            blit however many `Block`s have fallen.
+
+            Parameters
+            ----------
+            surface : pygame.Surface
+                Where to draw.
+            """
+
+            if self.image is None:
+                self.image = Background.get_image().copy()
+                Tetris.entities["fallen"].draw(self.image)
+            surface.blit(self.image, (0, 0))
 
         def grow(self):
             """ Making `Piece` part of the structure. """
@@ -514,33 +595,49 @@ class Tetris(Game):
             # `"fallen"` group.
             for block in Tetris.entities["piece"]:
                 block.add(Tetris.entities["fallen"])
+                Tetris.FallenBlocks.grid |= _cell_bit(*block.coords)
             Tetris.entities["piece"].empty()
+            self.image = None
 
-            # Update the structure's height.
-            h = min(
-                [20] + [block.coords[1]
-                        for block in Tetris.entities["fallen"]]
-            )
+            # Update the structure's height, from the highest row in
+            # the bitmask (its lowest bit set, see `_cell_bit`).
+            grid = Tetris.FallenBlocks.grid
+            if grid:
+                h = ((grid & -grid).bit_length()-1) // 10 - 2
+            else:
+                h = 20
             self.height = 20 - h
 
         def remove_full_lines(self):
-            full_lines = []
-            # Group all the completed lines (with 10 aligned `Block`s)
-            # into `full_lines`.
-            for b in range(20):
-                line = [block
-                        for block in Tetris.entities["fallen"]
-                        if block.coords[1] == b]
-                if len(line) == 10:
-                    full_lines.append((b, line))
-            # Remove them from the structure and lower the `Block`s
-            # above it.
-            for b, line in full_lines:
-                Tetris.entities["fallen"].remove(*line)
-                for block in Tetris.entities["fallen"]:
-                    i, j = block.coords
-                    if j < b:
-                        block.set_position(i, j+1)
+            # Find all the completed lines (with 10 aligned `Block`s)
+            # with the bitmask.
+            grid = Tetris.FallenBlocks.grid
+            full_lines = [b for b in range(20)
+                          if grid & _row_mask(b) == _row_mask(b)]
+            if not full_lines:
+                return 0
+            # Remove them from the bitmask, from the top down: the rows
+            # above `b` take one more row of bits, and the rows below
+            # stay.
+            for b in full_lines:
+                above = grid & ((1 << (b+2)*10) - 1)
+                below = grid >> (b+3)*10 << (b+3)*10
+                grid = below | above << 10
+            Tetris.FallenBlocks.grid = grid
+            # Remove them from the structure and lower each `Block`
+            # above by the number of lines removed below it, in a
+            # single pass.
+            removed = []
+            for block in Tetris.entities["fallen"].sprites():
+                i, j = block.coords
+                if j in full_lines:
+                    removed.append(block)
+                else:
+                    drop = sum(1 for b in full_lines if j < b)
+                    if drop:
+                        block.set_position(i, j+drop)
+            Tetris.entities["fallen"].remove(*removed)
+            self.image = None
             
             return len(full_lines)  # Used for scoring.
 
@@ -564,6 +661,11 @@ class Client(BaseClient):
         ----------
         t : int
             A timer.
+
+        Returns
+        -------
+        list[pygame.Rect] or None
+            The areas of the screen to update (all of it with ``None``).
         """
 
         # Update `Block`'s mechanics.
@@ -573,7 +675,7 @@ class Client(BaseClient):
         self.game.manage(t)
 
         # Draw the game objects to the screen.
-        self.game.draw_entities()
+        return self.game.draw_entities()
 
     def handle_events(self, key, state):
         """
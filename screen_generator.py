@@ -7,18 +7,16 @@ This module contains classes used to create the following screens:
 * high_scores
 * game previews
 
-All screens constructed and drawn at runtime as `pygame.Surface`
-objects, and must be instantiated to be shown.
+All screens are drawn at runtime as `pygame.Surface` objects the first
+time they are instantiated, then copied on each following one.
 
 Except for `high_scores`, each of the screens is made of an arrangement
 of dark `Block`s on top of a 20x10 grid of lighter `Block`s.
 """
 
-import json
 import pygame
-from abc import ABC, abstractmethod
 from .constants import *
-from .client import high_scores_dir
+from .client import load_high_scores
 from .block import Block
 
 __all__ = ["Background",
@@ -28,21 +26,92 @@ __all__ = ["Background",
            "show_high_scores",
            ]
 
-
-class BaseScreen(ABC):
-    """ Abstract class with a general constructor for drawing the screens. """
+_high_scores_screen = None
+""" The drawn high scores screen. """
+_high_scores_key = None
+""" The high scores drawn in `_high_scores_screen`, as (name, score) pairs. """
+_font = None
+""" Font of `show_high_scores`, created on first use. """
+_text_surfaces = {}
+""" Lines rendered by `show_high_scores`, shared by all calls (text:surface). """
+_CELL_POSITIONS = {j: tuple((BORDER_WIDTH + i*DIST_BLOCKS,
+                             BORDER_WIDTH + j*DIST_BLOCKS)
+                            for i in range(10))
+                   for j in range(20)}
+""" Pixel position of each cell of the grid (row:positions by column). """
+
+
+class BaseScreen:
+    """ Base class with a general constructor for drawing the screens. """
+
+    sketch = {}
+    """ Columns (values) filled with dark `Block`s in each row (keys). """
+    _images = {}
+    """ Drawn screens, shared by all instances (class:surface). """
 
     def __init__(self):
         """ Access the current active `pygame.Surface` and draw to it. """
 
-        # Initialize the `Group` to update and draw the `Block` sprites.
-        self.render = pygame.sprite.RenderPlain()
-        
-        # Access the current active `Surface` and draw in it.
+        # Access the current active `Surface` and copy the screen to it.
         screen = pygame.display.get_surface()
-        self.draw(screen)
+        screen.blit(self.get_image(), (0, 0))
+
+    def get_image(self):
+        """
+        The screen as a `pygame.Surface`, drawn on the first call.
+
+        Returns
+        -------
+        pygame.Surface
+            The screen, shared by all instances of its class once the
+            display is set.
+        """
+
+        return BaseScreen._images.get(type(self)) or self._build_image()
+
+    def _build_image(self):
+        """
+        Draw the screen onto a new `pygame.Surface`.
+
+        Returns
+        -------
+        pygame.Surface
+            The screen, keeping the display's pixel format.
+        """
+
+        # Draw over a copy of the `Background`.
+        image = Background.get_image().copy()
+        self.draw(image)
+
+        # `convert` needs a display; until there is one, draw again on
+        # the next call.
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+            BaseScreen._images[type(self)] = image
+        return image
     
-    @abstractmethod
+    @staticmethod
+    def _draw_sketch(surface, sketch, color=LINE_COLOR):
+        """
+        Copy a `Block` to each cell of ``sketch`` in a single call.
+
+        Parameters
+        ----------
+        surface : pygame.Surface
+            Where to draw.
+        sketch : dict[int, tuple[int, ...]]
+            Columns (values) filled in each row (keys) of the grid.
+        color : tuple[int, int, int], optional
+            Color of the `Block`s. Defaults to ``LINE_COLOR``.
+        """
+
+        image = Block(0, 0, color=color).image
+        surface.blits([(image, _CELL_POSITIONS[j][i])
+                       for j, row in sketch.items()
+                       for i in row],
+                      doreturn=False,
+                      )
+
     def draw(self, surface):
         """
         Positioning the `Block` objects in a 20x10 grid.
@@ -53,123 +122,121 @@ class BaseScreen(ABC):
             Where to draw.
         """
 
-        pass
+        self._draw_sketch(surface, self.sketch)
 
 
 class Background(BaseScreen):
     """ A 20x10 grid of `Block` sprites colored ``SHADE_COLOR``. """
 
+    _image = None
+    """ The drawn background, shared by all instances. """
+
     def draw(self, surface):
         """
         Positioning the `Block` objects in a 20x10 grid.
 
+        The grid is drawn only once, then copied from `_image`.
+
         Parameters
         ----------
         surface : pygame.Surface
             Where to draw.
         """
 
-        surface.fill(BACK_COLOR)
+        surface.blit(Background.get_image(), (0, 0))
+
+    @staticmethod
+    def get_image():
+        """
+        The background as a `pygame.Surface`, drawn on the first call.
+
+        Returns
+        -------
+        pygame.Surface
+            The background, keeping the display's pixel format.
+        """
+
+        return Background._image or Background._build_image()
+
+    @staticmethod
+    def _build_image():
+        """
+        Draw the background onto a new `pygame.Surface`.
+
+        Returns
+        -------
+        pygame.Surface
+            The background, keeping the display's pixel format.
+        """
+
+        image = pygame.Surface(RES)
+        image.fill(BACK_COLOR)
         
         # Border
         border = pygame.Rect(0, 0, *RES)
-        pygame.draw.rect(surface,
+        pygame.draw.rect(image,
                          LINE_COLOR,
                          border,
                          BORDER_WIDTH,
                          )
         
         # Grid
-        for i in range(10):
-            for j in range(20):
-                Block(i, j, color=SHADE_COLOR).add(self.render)
-        
-        self.render.draw(surface)
+        Background._draw_sketch(image,
+                                {j: range(10) for j in range(20)},
+                                color=SHADE_COLOR,
+                                )
+
+        # `convert` needs a display; until there is one, draw again on
+        # the next call.
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+            Background._image = image
+        return image
 
 
 class VictoryScreen(BaseScreen):
     """ A *You Win* message. """
     
-    def __init__(self):
-        Background()
-        super().__init__()
-    
-    def draw(self, surface):
-        """
-        Positioning the `Block` objects in a 20x10 grid.
-
-        Parameters
-        ----------
-        surface : pygame.Surface
-            Where to draw.
-        """
-        
-        sketch = { 1: (0,    2,       5,          9),
-                   2: (0,    2,       5,          9),
-                   3: (0, 1, 2,       5,    7,    9),
-                   4: (      2,       5, 6, 7, 8, 9),
-                   5: (0, 1, 2,       5, 6,    8, 9),
-                   
-                   7: (0, 1, 2,          6, 7, 8   ),
-                   8: (0,    2,             7      ),
-                   9: (0,    2,             7      ),
-                  10: (0, 1, 2,          6, 7, 8   ),
-                  
-                  12: (0,    2,       5, 6,       9),
-                  13: (0,    2,       5, 6, 7,    9),
-                  14: (0,    2,       5,    7, 8, 9),
-                  15: (0, 1, 2,       5,       8, 9)}
-
-        for j in sketch.keys():
-            for i in sketch[j]:
-                Block(i, j).add(self.render)
-        
-        self.render.draw(surface)
+    sketch = { 1: (0,    2,       5,          9),
+               2: (0,    2,       5,          9),
+               3: (0, 1, 2,       5,    7,    9),
+               4: (      2,       5, 6, 7, 8, 9),
+               5: (0, 1, 2,       5, 6,    8, 9),
+               
+               7: (0, 1, 2,          6, 7, 8   ),
+               8: (0,    2,             7      ),
+               9: (0,    2,             7      ),
+              10: (0, 1, 2,          6, 7, 8   ),
+              
+              12: (0,    2,       5, 6,       9),
+              13: (0,    2,       5, 6, 7,    9),
+              14: (0,    2,       5,    7, 8, 9),
+              15: (0, 1, 2,       5,       8, 9)}
 
 
 class DefeatScreen(BaseScreen):
     """ A *Game Over* message. """
     
-    def __init__(self) -> None:
-        Background()
-        super().__init__()
-    
-    def draw(self, surface):
-        """
-        Positioning the `Block` objects in a 20x10 grid.
-
-        Parameters
-        ----------
-        surface : pygame.Surface
-            Where to draw.
-        """
-
-        sketch = {0: (   1, 2, 3, 4,       7, 8, 9),
-                  1: (0,                   7,    9),
-                  2: (0,    2, 3, 4,       7,    9),
-                  3: (0,          4,       7, 8, 9),
-                  4: (   1, 2, 3                  ),          
-                  5: (                     7,    9),
-                  6: (   1, 2, 3,          7,    9),
-                  7: (0,          4,       7,    9),
-                  8: (0, 1, 2, 3, 4,          8   ),  
-                  9: (0,          4               ),          
-                 10: (                     7, 8, 9),
-                 11: (0,          4,       7      ),    
-                 12: (0, 1,    3, 4,       7, 8, 9),
-                 13: (0,    2,    4,       7      ),    
-                 14: (                     7, 8, 9),
-                 15: (   1, 2, 3                  ),            
-                 16: (   1,                7, 8   ),  
-                 17: (   1, 2, 3,          7,    9),
-                 18: (   1,                7, 8   ),  
-                 19: (   1, 2, 3,          7,    9)}
-
-        for j in sketch.keys():
-            for i in sketch[j]:
-                Block(i, j).add(self.render)
-        
-        self.render.draw(surface)
+    sketch = {0: (   1, 2, 3, 4,       7, 8, 9),
+              1: (0,                   7,    9),
+              2: (0,    2, 3, 4,       7,    9),
+              3: (0,          4,       7, 8, 9),
+              4: (   1, 2, 3                  ),          
+              5: (                     7,    9),
+              6: (   1, 2, 3,          7,    9),
+              7: (0,          4,       7,    9),
+              8: (0, 1, 2, 3, 4,          8   ),  
+              9: (0,          4               ),          
+             10: (                     7, 8, 9),
+             11: (0,          4,       7      ),    
+             12: (0, 1,    3, 4,       7, 8, 9),
+             13: (0,    2,    4,       7      ),    
+             14: (                     7, 8, 9),
+             15: (   1, 2, 3                  ),            
+             16: (   1,                7, 8   ),  
+             17: (   1, 2, 3,          7,    9),
+             18: (   1,                7, 8   ),  
+             19: (   1, 2, 3,          7,    9)}
 
 
 class GamePreview:
@@ -178,637 +245,404 @@ class GamePreview:
     class Snake1(BaseScreen):
         """ First preview for Snake. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-
-            sketch = { 0: (                            ),
-                       1: (                            ),
-                       2: (                            ),
-                       3: (      2, 3, 4, 5, 6, 7,     ),
-                       4: (                            ),
-                       5: (                            ),
-                       6: (                            ),
-                       7: (                     7,     ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (                            ),
-                      11: (                            ),
-                      12: (                            ),
-                      13: (                            ),
-                      14: (                            ),
-                      15: (            4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3, 4, 5, 6,        ),
-                      18: (         3,       6,        ),
-                      19: (         3,       6,        )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (                            ),
+                   1: (                            ),
+                   2: (                            ),
+                   3: (      2, 3, 4, 5, 6, 7,     ),
+                   4: (                            ),
+                   5: (                            ),
+                   6: (                            ),
+                   7: (                     7,     ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (                            ),
+                  11: (                            ),
+                  12: (                            ),
+                  13: (                            ),
+                  14: (                            ),
+                  15: (            4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3, 4, 5, 6,        ),
+                  18: (         3,       6,        ),
+                  19: (         3,       6,        )}
 
     class Snake2(BaseScreen):
         """ Second preview for Snake. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (                            ),
-                       1: (                            ),
-                       2: (                            ),
-                       3: (         3, 4, 5, 6, 7,     ),
-                       4: (                     7,     ),
-                       5: (                            ),
-                       6: (                            ),
-                       7: (                     7,     ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (                            ),
-                      11: (                            ),
-                      12: (                            ),
-                      13: (                            ),
-                      14: (                            ),
-                      15: (            4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3, 4, 5, 6,        ),
-                      18: (         3,       6,        ),
-                      19: (         3,       6,        )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (                            ),
+                   1: (                            ),
+                   2: (                            ),
+                   3: (         3, 4, 5, 6, 7,     ),
+                   4: (                     7,     ),
+                   5: (                            ),
+                   6: (                            ),
+                   7: (                     7,     ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (                            ),
+                  11: (                            ),
+                  12: (                            ),
+                  13: (                            ),
+                  14: (                            ),
+                  15: (            4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3, 4, 5, 6,        ),
+                  18: (         3,       6,        ),
+                  19: (         3,       6,        )}
     
     class Snake3(BaseScreen):
         """ Third preview for Snake. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (                            ),
-                       1: (                            ),
-                       2: (                            ),
-                       3: (            4, 5, 6, 7,     ),
-                       4: (                     7,     ),
-                       5: (                     7,     ),
-                       6: (                            ),
-                       7: (                     7,     ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (                            ),
-                      11: (                            ),
-                      12: (                            ),
-                      13: (                            ),
-                      14: (                            ),
-                      15: (            4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3, 4, 5, 6,        ),
-                      18: (         3,       6,        ),
-                      19: (         3,       6,        )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (                            ),
+                   1: (                            ),
+                   2: (                            ),
+                   3: (            4, 5, 6, 7,     ),
+                   4: (                     7,     ),
+                   5: (                     7,     ),
+                   6: (                            ),
+                   7: (                     7,     ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (                            ),
+                  11: (                            ),
+                  12: (                            ),
+                  13: (                            ),
+                  14: (                            ),
+                  15: (            4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3, 4, 5, 6,        ),
+                  18: (         3,       6,        ),
+                  19: (         3,       6,        )}
             
     class Breakout1(BaseScreen):
         """ First preview for Breakout. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                       1: (0,                         9),
-                       2: (0,                         9),
-                       3: (0,       3, 4, 5, 6,       9),
-                       4: (0,       3, 4, 5, 6,       9),
-                       5: (0,       3, 4, 5, 6,       9),
-                       6: (0,       3, 4, 5, 6,       9),
-                       7: (0,                         9),
-                       8: (0,                         9),
-                       9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                      10: (                            ),
-                      11: (               5,           ),
-                      12: (                            ),
-                      13: (         3, 4, 5,           ),
-                      14: (                            ),
-                      15: (         3, 4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3, 4, 5,           ),
-                      18: (         3,       6,        ),
-                      19: (         3, 4, 5,           )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+                   1: (0,                         9),
+                   2: (0,                         9),
+                   3: (0,       3, 4, 5, 6,       9),
+                   4: (0,       3, 4, 5, 6,       9),
+                   5: (0,       3, 4, 5, 6,       9),
+                   6: (0,       3, 4, 5, 6,       9),
+                   7: (0,                         9),
+                   8: (0,                         9),
+                   9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+                  10: (                            ),
+                  11: (               5,           ),
+                  12: (                            ),
+                  13: (         3, 4, 5,           ),
+                  14: (                            ),
+                  15: (         3, 4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3, 4, 5,           ),
+                  18: (         3,       6,        ),
+                  19: (         3, 4, 5,           )}
     
     class Breakout2(BaseScreen):
         """ Second preview for Breakout. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                       1: (0,                         9),
-                       2: (0,                         9),
-                       3: (0,       3, 4, 5, 6,       9),
-                       4: (0,       3, 4, 5, 6,       9),
-                       5: (0,       3, 4, 5, 6,       9),
-                       6: (0,       3, 4, 5, 6,       9),
-                       7: (0,                         9),
-                       8: (0,                         9),
-                       9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                      10: (                  6,        ),
-                      11: (                            ),
-                      12: (                            ),
-                      13: (         3, 4, 5,           ),
-                      14: (                            ),
-                      15: (         3, 4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3, 4, 5,           ),
-                      18: (         3,       6,        ),
-                      19: (         3, 4, 5,           )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+                   1: (0,                         9),
+                   2: (0,                         9),
+                   3: (0,       3, 4, 5, 6,       9),
+                   4: (0,       3, 4, 5, 6,       9),
+                   5: (0,       3, 4, 5, 6,       9),
+                   6: (0,       3, 4, 5, 6,       9),
+                   7: (0,                         9),
+                   8: (0,                         9),
+                   9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+                  10: (                  6,        ),
+                  11: (                            ),
+                  12: (                            ),
+                  13: (         3, 4, 5,           ),
+                  14: (                            ),
+                  15: (         3, 4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3, 4, 5,           ),
+                  18: (         3,       6,        ),
+                  19: (         3, 4, 5,           )}
     
     class Breakout3(BaseScreen):
         """ Third preview for Breakout. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                       1: (0,                         9),
-                       2: (0,                         9),
-                       3: (0,       3, 4, 5, 6,       9),
-                       4: (0,       3, 4, 5, 6,       9),
-                       5: (0,       3, 4, 5, 6,       9),
-                       6: (0,       3, 4, 5, 6,       9),
-                       7: (0,                         9),
-                       8: (0,                         9),
-                       9: (0, 1, 2, 3, 4, 5,       8, 9),
-                      10: (                            ),
-                      11: (                     7,     ),
-                      12: (                            ),
-                      13: (            4, 5, 6,        ),
-                      14: (                            ),
-                      15: (         3, 4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3, 4, 5,           ),
-                      18: (         3,       6,        ),
-                      19: (         3, 4, 5,           )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+                   1: (0,                         9),
+                   2: (0,                         9),
+                   3: (0,       3, 4, 5, 6,       9),
+                   4: (0,       3, 4, 5, 6,       9),
+                   5: (0,       3, 4, 5, 6,       9),
+                   6: (0,       3, 4, 5, 6,       9),
+                   7: (0,                         9),
+                   8: (0,                         9),
+                   9: (0, 1, 2, 3, 4, 5,       8, 9),
+                  10: (                            ),
+                  11: (                     7,     ),
+                  12: (                            ),
+                  13: (            4, 5, 6,        ),
+                  14: (                            ),
+                  15: (         3, 4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3, 4, 5,           ),
+                  18: (         3,       6,        ),
+                  19: (         3, 4, 5,           )}
     
     class Asteroids1(BaseScreen):
         """ First preview for Asteroids. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (0, 1, 2, 3,             8, 9),
-                       1: (0,    2,    4, 5, 6, 7,    9),
-                       2: (0,    2,                   9),
-                       3: (0,       3, 4, 5,           ),
-                       4: (   1,                       ),
-                       5: (            4,              ),
-                       6: (                            ),
-                       7: (                            ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (                            ),
-                      11: (                            ),
-                      12: (            4,              ),
-                      13: (            4,              ),
-                      14: (                            ),
-                      15: (            4, 5, 6,        ),
-                      16: (         3,                 ),
-                      17: (         3,                 ),
-                      18: (         3,                 ),
-                      19: (            4, 5, 6,        )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (0, 1, 2, 3,             8, 9),
+                   1: (0,    2,    4, 5, 6, 7,    9),
+                   2: (0,    2,                   9),
+                   3: (0,       3, 4, 5,           ),
+                   4: (   1,                       ),
+                   5: (            4,              ),
+                   6: (                            ),
+                   7: (                            ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (                            ),
+                  11: (                            ),
+                  12: (            4,              ),
+                  13: (            4,              ),
+                  14: (                            ),
+                  15: (            4, 5, 6,        ),
+                  16: (         3,                 ),
+                  17: (         3,                 ),
+                  18: (         3,                 ),
+                  19: (            4, 5, 6,        )}
     
     class Asteroids2(BaseScreen):
         """ Second preview for Asteroids. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (0, 1, 2, 3,             8, 9),
-                       1: (0,    2,    4, 5, 6, 7,    9),
-                       2: (0,    2,                   9),
-                       3: (0,       3, 4, 5,           ),
-                       4: (   1,       4,              ),
-                       5: (                            ),
-                       6: (                            ),
-                       7: (                            ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (                            ),
-                      11: (            4,              ),
-                      12: (                            ),
-                      13: (            4,              ),
-                      14: (                            ),
-                      15: (            4, 5, 6,        ),
-                      16: (         3,                 ),
-                      17: (         3,                 ),
-                      18: (         3,                 ),
-                      19: (            4, 5, 6,        )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (0, 1, 2, 3,             8, 9),
+                   1: (0,    2,    4, 5, 6, 7,    9),
+                   2: (0,    2,                   9),
+                   3: (0,       3, 4, 5,           ),
+                   4: (   1,       4,              ),
+                   5: (                            ),
+                   6: (                            ),
+                   7: (                            ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (                            ),
+                  11: (            4,              ),
+                  12: (                            ),
+                  13: (            4,              ),
+                  14: (                            ),
+                  15: (            4, 5, 6,        ),
+                  16: (         3,                 ),
+                  17: (         3,                 ),
+                  18: (         3,                 ),
+                  19: (            4, 5, 6,        )}
     
     class Asteroids3(BaseScreen):
         """ Third preview for Asteroids. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (0, 1, 2, 3,             8, 9),
-                       1: (0,    2,    4, 5, 6, 7,    9),
-                       2: (0,    2,                   9),
-                       3: (0,       3,    5,           ),
-                       4: (   1,                       ),
-                       5: (                            ),
-                       6: (                            ),
-                       7: (                            ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (            4,              ),
-                      11: (                            ),
-                      12: (                            ),
-                      13: (            4,              ),
-                      14: (                            ),
-                      15: (            4, 5, 6,        ),
-                      16: (         3,                 ),
-                      17: (         3,                 ),
-                      18: (         3,                 ),
-                      19: (            4, 5, 6,        )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (0, 1, 2, 3,             8, 9),
+                   1: (0,    2,    4, 5, 6, 7,    9),
+                   2: (0,    2,                   9),
+                   3: (0,       3,    5,           ),
+                   4: (   1,                       ),
+                   5: (                            ),
+                   6: (                            ),
+                   7: (                            ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (            4,              ),
+                  11: (                            ),
+                  12: (                            ),
+                  13: (            4,              ),
+                  14: (                            ),
+                  15: (            4, 5, 6,        ),
+                  16: (         3,                 ),
+                  17: (         3,                 ),
+                  18: (         3,                 ),
+                  19: (            4, 5, 6,        )}
     
     class Tetris1(BaseScreen):
         """ First preview for Tetris. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (                            ),
-                       1: (         3, 4, 5,           ),
-                       2: (            4,              ),
-                       3: (                            ),
-                       4: (                            ),
-                       5: (                            ),
-                       6: (                            ),
-                       7: (                            ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (0,                          ),
-                      11: (0,                          ),
-                      12: (0, 1, 2,          6, 7,     ),
-                      13: (0, 1, 2, 3,    5, 6, 7, 8, 9),
-                      14: (                            ),
-                      15: (         3, 4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3,       6,        ),
-                      18: (         3,       6,        ),
-                      19: (         3, 4, 5,           )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (                            ),
+                   1: (         3, 4, 5,           ),
+                   2: (            4,              ),
+                   3: (                            ),
+                   4: (                            ),
+                   5: (                            ),
+                   6: (                            ),
+                   7: (                            ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (0,                          ),
+                  11: (0,                          ),
+                  12: (0, 1, 2,          6, 7,     ),
+                  13: (0, 1, 2, 3,    5, 6, 7, 8, 9),
+                  14: (                            ),
+                  15: (         3, 4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3,       6,        ),
+                  18: (         3,       6,        ),
+                  19: (         3, 4, 5,           )}
     
     class Tetris2(BaseScreen):
         """ Second preview for Tetris. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (                            ),
-                       1: (                            ),
-                       2: (         3, 4, 5,           ),
-                       3: (            4,              ),
-                       4: (                            ),
-                       5: (                            ),
-                       6: (                            ),
-                       7: (                            ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (0,                          ),
-                      11: (0,                          ),
-                      12: (0, 1, 2,          6, 7,     ),
-                      13: (0, 1, 2, 3,    5, 6, 7, 8, 9),
-                      14: (                            ),
-                      15: (         3, 4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3,       6,        ),
-                      18: (         3,       6,        ),
-                      19: (         3, 4, 5,           )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (                            ),
+                   1: (                            ),
+                   2: (         3, 4, 5,           ),
+                   3: (            4,              ),
+                   4: (                            ),
+                   5: (                            ),
+                   6: (                            ),
+                   7: (                            ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (0,                          ),
+                  11: (0,                          ),
+                  12: (0, 1, 2,          6, 7,     ),
+                  13: (0, 1, 2, 3,    5, 6, 7, 8, 9),
+                  14: (                            ),
+                  15: (         3, 4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3,       6,        ),
+                  18: (         3,       6,        ),
+                  19: (         3, 4, 5,           )}
     
     class Tetris3(BaseScreen):
         """ Third preview for Tetris. """
         
-        def __init__(self) -> None:
-            Background()
-            super().__init__()
-        
-        def draw(self, surface):
-            """
-            Positioning the `Block` objects in a 20x10 grid.
-
-            Parameters
-            ----------
-            surface : pygame.Surface
-                Where to draw.
-            """
-            
-            sketch = { 0: (                            ),
-                       1: (                            ),
-                       2: (                            ),
-                       3: (         3, 4, 5,           ),
-                       4: (            4,              ),
-                       5: (                            ),
-                       6: (                            ),
-                       7: (                            ),
-                       8: (                            ),
-                       9: (                            ),
-                      10: (0,                          ),
-                      11: (0,                          ),
-                      12: (0, 1, 2,          6, 7,     ),
-                      13: (0, 1, 2, 3,    5, 6, 7, 8, 9),
-                      14: (                            ),
-                      15: (         3, 4, 5,           ),
-                      16: (         3,       6,        ),
-                      17: (         3,       6,        ),
-                      18: (         3,       6,        ),
-                      19: (         3, 4, 5,           )}
-            
-            for j in sketch.keys():
-                for i in sketch[j]:
-                    Block(i, j).add(self.render)
-            
-            self.render.draw(surface)
+        sketch = { 0: (                            ),
+                   1: (                            ),
+                   2: (                            ),
+                   3: (         3, 4, 5,           ),
+                   4: (            4,              ),
+                   5: (                            ),
+                   6: (                            ),
+                   7: (                            ),
+                   8: (                            ),
+                   9: (                            ),
+                  10: (0,                          ),
+                  11: (0,                          ),
+                  12: (0, 1, 2,          6, 7,     ),
+                  13: (0, 1, 2, 3,    5, 6, 7, 8, 9),
+                  14: (                            ),
+                  15: (         3, 4, 5,           ),
+                  16: (         3,       6,        ),
+                  17: (         3,       6,        ),
+                  18: (         3,       6,        ),
+                  19: (         3, 4, 5,           )}
     
 # Template for more screens.
 '''
 class Newgamei(BaseScreen):
     """ ith preview for Newgame. """
     
-    def __init__(self) -> None:
-        Background()
-        super().__init__()
-    
-    def draw(self, surface):
-        """
-        Positioning the `Block` objects in a 20x10 grid.
-
-        Parameters
-        ----------
-        surface : pygame.Surface
-            Where to draw.
-        """
-        
-        sketch = { 0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   1: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   2: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   3: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   4: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   5: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   6: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   7: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   8: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                   9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  10: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  11: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  12: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  13: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  14: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  15: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  16: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  17: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  18: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
-                  19: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)}
-
-        for j in sketch.keys():
-            for i in sketch[j]:
-                Block(i, j).add(self.render)
-
-        self.render.draw(surface)
+    sketch = { 0: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               1: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               2: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               3: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               4: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               5: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               6: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               7: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               8: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+               9: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              10: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              11: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              12: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              13: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              14: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              15: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              16: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              17: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              18: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+              19: (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)}
 '''
 
-def show_high_scores():
-    """ Read, format, and show all entries from `high-scores.json`. """
-
-    # Access the current active surface.
-    screen = pygame.display.get_surface()
-
-    # Update the window title.
-    pygame.display.set_caption("High Scores")
+def _render_text(text):
+    """
+    Render a line of `show_high_scores`, once for each ``text``.
+
+    Parameters
+    ----------
+    text : str
+        What to write.
+
+    Returns
+    -------
+    pygame.Surface
+        The rendered line, keeping the display's pixel format.
+    """
+
+    global _font
+    text_surface = _text_surfaces.get(text)
+    if text_surface is None:
+        # Looking up a system font is slow, so it's done only once.
+        if _font is None:
+            _font = pygame.font.SysFont(None,
+                                        size=12*PIXEL_SIDE,
+                                        )
+        text_surface = _font.render(text,
+                                    False,
+                                    LINE_COLOR,
+                                    BACK_COLOR,
+                                    ).convert()
+        _text_surfaces[text] = text_surface
+    return text_surface
+
+
+def _draw_high_scores(surface, high_scores):
+    """
+    Draw the high scores screen.
+
+    Parameters
+    ----------
+    surface : pygame.Surface
+        Where to draw.
+    high_scores : dict
+        The highest score of each game (name:score).
+    """
 
     # Set a background.
-    screen.fill(BACK_COLOR)
+    surface.fill(BACK_COLOR)
 
     # Border
     border = pygame.Rect(0, 0, *RES)
-    pygame.draw.rect(surface=screen,
+    pygame.draw.rect(surface=surface,
                      color=LINE_COLOR,
                      rect=border,
                      width=BORDER_WIDTH,
                      )
     
-    # Set a font.
-    font = pygame.font.SysFont(None,
-                               size=12*PIXEL_SIDE,
-                               )
-
-    # Draw the high scores.
-    high_scores = {}
-    try:
-        # Extract from the .json file.
-        with open(high_scores_dir, "r") as file:
-            high_scores = json.load(file)
-    except Exception as e:
-        print(e)
-        pass
     # Draw the title on the screen.
     h = DIST_BLOCKS
     text = "{0:^25s}".format("HIGH SCORES")  # Centered on top.
-    text_surface = font.render(text,
-                               False,
-                               LINE_COLOR,
-                               BACK_COLOR,
-                               )
-    screen.blit(text_surface, (DIST_BLOCKS, h))
+    surface.blit(_render_text(text), (DIST_BLOCKS, h))
     
     # Iterate through the high scores.
     for game_name, score in high_scores.items():
         h += 2*DIST_BLOCKS
         # First row: game names.
-        text_surface = font.render(game_name,
-                                   False,
-                                   LINE_COLOR,
-                                   BACK_COLOR,
-                                   )
-        screen.blit(text_surface, (DIST_BLOCKS, h))
+        surface.blit(_render_text(game_name), (DIST_BLOCKS, h))
         # Second row: game scores.
         text_score = f"{score:07d}"
-        text_surface = font.render(text_score,
-                                   False,
-                                   LINE_COLOR,
-                                   BACK_COLOR,
-                                   )
-        screen.blit(text_surface, (6*DIST_BLOCKS, h))
+        surface.blit(_render_text(text_score), (6*DIST_BLOCKS, h))
+
+
+def show_high_scores():
+    """ Read, format, and show all entries from `high-scores.json`. """
+
+    global _high_scores_screen, _high_scores_key
+
+    # Access the current active surface.
+    screen = pygame.display.get_surface()
+
+    # Update the window title.
+    pygame.display.set_caption("High Scores")
+
+    # Draw the high scores again only if they changed since last time.
+    high_scores = load_high_scores()
+    key = tuple(high_scores.items())
+    if key != _high_scores_key:
+        _high_scores_screen = pygame.Surface(RES).convert()
+        _draw_high_scores(_high_scores_screen, high_scores)
+        _high_scores_key = key
+    screen.blit(_high_scores_screen, (0, 0))
@@ -8,8 +8,8 @@ setup(
     author_email="mafigueiredo08@gmail.com",
     description="An exercise project with GUIs using pygame",
     url="https://github.com/marcantonio64/brickgame_pygame",
+    python_requires=">=3.6.8",
     install_requires=[
         'pygame>=2.0.1',
-        'python_version >= "3.6.8"',
     ],
 )
@@ -1,6 +1,7 @@
 """ Testing `block.py` elements. """
 
 import pygame
+from collections import deque
 from ..constants import BACK_COLOR, FPS
 from ..client import BaseClient
 from ..block import *
@@ -31,15 +32,15 @@ class Client(BaseClient):
 
         # Create groups and add sprites to them.
         self.entities = {
-            1: pygame.sprite.RenderPlain(),
-            2: pygame.sprite.RenderPlain(BlinkingBlock(5, 5)),
-            3: pygame.sprite.RenderPlain(),
-            4: pygame.sprite.RenderPlain(),
+            1: pygame.sprite.RenderUpdates(),
+            2: pygame.sprite.RenderUpdates(BlinkingBlock(5, 5)),
+            3: pygame.sprite.RenderUpdates(),
+            4: pygame.sprite.RenderUpdates(),
         }
 
         # First test's target: static `Block`s.
-        self.coords = [(3, 3), (3, 2)]
-        self.blocks = []  # Holds references.
+        self.coords = deque([(3, 3), (3, 2)])
+        self.blocks = deque()  # Holds references.
         for (i, j) in self.coords:
             block = Block(i, j, direction="down")
             block.add(self.entities[1])
@@ -63,8 +64,9 @@ class Client(BaseClient):
     def loop(self, t):
         """ List of scheduled events. """
 
-        # Clean the screen.
-        self.screen.fill(BACK_COLOR)
+        # Erase the sprites drawn in the previous frame.
+        for entity in self.entities.values():
+            entity.clear(self.screen, self.back)
 
         if t > 5*FPS:  # After 5 seconds, do...
 
@@ -73,8 +75,8 @@ class Client(BaseClient):
             # Draw a third `Block` below and store its data.
             block = Block(i, j+1)
             block.add(self.entities[1])
-            self.coords.insert(0, (i, j+1))
-            self.blocks.insert(0, block)
+            self.coords.appendleft((i, j+1))
+            self.blocks.appendleft(block)
             # Delete the first `Block`'s drawing and data, creating an
             # illusion of movement.
             self.blocks[-1].kill()
@@ -85,7 +87,7 @@ class Client(BaseClient):
             # and tracking its `image` attribute for 5 seconds.
             if t <= 10*FPS:
                 for blink in self.entities[2]:
-                    print(blink.image == blink._image)
+                    print(blink.image is blink._image)
 
             # Test `Bomb`'s methods.
             # Change for `"down"` to test the `Bomb`'s behavior when it
@@ -103,12 +105,17 @@ class Client(BaseClient):
 
         # Update sprites' mechanics.
         for entity in self.entities.values():
-            for block in entity:
-                block.update(t=t, speed=1)
+            entity.update(t=t, speed=1)
 
-        # Draw the objects to the screen.
+        # Draw the objects to the screen, keeping the changed areas.
+        dirty = []
         for entity in self.entities.values():
-            entity.draw(self.screen)
+            dirty += entity.draw(self.screen)
+
+        # Show the whole background once, then only what changed.
+        if t == 1:
+            return None
+        return dirty
 
 
 def main():
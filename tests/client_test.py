@@ -26,33 +26,31 @@ class Client3(Client2):
 
     def __init__(self):
         super().__init__()
-        self.image = None
-        self.rect = None
+        # Create a small surface to draw on, once for all squares.
+        self.image = pygame.Surface((BLOCK_SIDE, BLOCK_SIDE))
+        self.image.fill(BACK_COLOR)
+        # Draw an empty square in this smaller surface.
+        pygame.draw.rect(
+            self.image,
+            LINE_COLOR,
+            pygame.Rect(0, 0, BLOCK_SIDE, BLOCK_SIDE),
+            PIXEL_SIDE,
+        )
+        # Match the display's pixel format for faster blits.
+        self.image = self.image.convert()
+        # Extract its `.rect` container.
+        self.rect = self.image.get_rect()
         self.j = 1
         self.draw_square(0, 0)
 
     def draw_square(self, i, j):
         """ Draw a `LINE_COLOR` square on `self.screen`. """
 
-        # Create a small surface to draw on.
-        self.image = pygame.Surface((BLOCK_SIDE, BLOCK_SIDE))
-        self.image.fill(BACK_COLOR)
-        # Extract its `.rect` container.
-        self.rect = self.image.get_rect()
         # Place it according to `i` and `j`.
         self.rect.topleft = (
             BORDER_WIDTH + i*DIST_BLOCKS,
             BORDER_WIDTH + j*DIST_BLOCKS
         )
-        # Draw an empty square in this smaller surface.
-        pygame.draw.rect(
-            self.image,
-            LINE_COLOR,
-            pygame.Rect(0, 0, BLOCK_SIDE, BLOCK_SIDE),
-            PIXEL_SIDE,
-        )
-        # Update (blit) the drawing to the smaller surface.
-        self.image.blit(self.image, (0, 0))
         # Update (blit) the smaller surface to the original.
         self.screen.blit(self.image, self.rect)
 
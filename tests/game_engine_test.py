@@ -64,8 +64,8 @@ class Client(BaseClient):
         # Implement the game mechanics and check for endgame.
         self.game.manage()
 
-        # Draw the game objects to the screen.
-        self.game.draw_entities()
+        # Draw the game objects to the screen, if anything changed.
+        changed = self.game.draw_entities()
 
         # Tests for `game`'s methods.
         if t == FPS*10:    # 10 seconds mark.
@@ -75,6 +75,8 @@ class Client(BaseClient):
         elif t == 20*FPS:  # 20 seconds mark.
             self.game.reset()
 
+        return changed
+
     def handle_events(self, key, state):
         """ Deal with user input. """
         self.game.handle_events(key, state)